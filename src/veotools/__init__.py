@@ -19,7 +19,8 @@ from .generate.video import (
 from .process.extractor import (
     extract_frame,
     extract_frames,
-    get_video_info
+    get_video_info,
+    get_video_info_batch,
 )
 
 from .stitch.seamless import (
@@ -76,6 +77,7 @@ __all__ = [
     "extract_frame",
     "extract_frames",
     "get_video_info",
+    "get_video_info_batch",
     "stitch_videos",
     "stitch_with_transitions",
     "create_transition_points",
@@ -19,6 +19,8 @@ Design notes:
 - A background thread runs the blocking generation call and updates job state
   via the JobStore. Cancellation is cooperative: the on_progress callback
   checks a cancel flag in the persisted job state and raises Cancelled.
+- Every JobStore write notifies in-process listeners registered with
+  subscribe_job_updates(), so waiters can react without re-reading the file.
 """
 
 from __future__ import annotations
@@ -73,6 +75,42 @@ ERROR_CODES = {
 # Job persistence
 # ----------------------------
 
+_job_listeners: list[Callable[[str], None]] = []
+_job_listeners_lock = threading.Lock()
+
+
+def subscribe_job_updates(listener: Callable[[str], None]) -> Callable[[], None]:
+    """Register a callback invoked with the job_id after every JobStore write.
+
+    Listeners run on the writing thread (usually a generation worker), so they
+    must be quick and thread-safe. Writes from other processes are not seen.
+
+    Args:
+        listener: Callable receiving the updated job's id.
+
+    Returns:
+        Callable[[], None]: Function that unregisters the listener.
+    """
+    with _job_listeners_lock:
+        _job_listeners.append(listener)
+
+    def _unsubscribe() -> None:
+        with _job_listeners_lock:
+            if listener in _job_listeners:
+                _job_listeners.remove(listener)
+
+    return _unsubscribe
+
+
+def _notify_job_update(job_id: str) -> None:
+    with _job_listeners_lock:
+        listeners = list(_job_listeners)
+    for listener in listeners:
+        try:
+            listener(job_id)
+        except Exception:
+            pass
+
 
 @dataclass
 class JobRecord:
@@ -167,6 +205,7 @@ class JobStore:
         """
         path = self._path(record.job_id)
         path.write_text(record.to_json(), encoding="utf-8")
+        _notify_job_update(record.job_id)
 
     def read(self, job_id: str) -> Optional[JobRecord]:
         """Read a job record from disk.
@@ -180,11 +219,28 @@ class JobStore:
         Raises:
             json.JSONDecodeError: If the stored JSON is invalid.
         """
-        path = self._path(job_id)
-        if not path.exists():
+        data = self.read_dict(job_id)
+        return JobRecord(**data) if data is not None else None
+
+    def read_dict(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Read a job record from disk as the stored JSON object.
+
+        Skips building a JobRecord, for callers that only serialize the record.
+
+        Args:
+            job_id: The unique job identifier.
+
+        Returns:
+            dict: The stored job fields if found, None otherwise.
+
+        Raises:
+            json.JSONDecodeError: If the stored JSON is invalid.
+        """
+        try:
+            text = self._path(job_id).read_text(encoding="utf-8")
+        except FileNotFoundError:
             return None
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return JobRecord(**data)
+        return json.loads(text)
 
     def update(self, record: JobRecord, **updates: Any) -> JobRecord:
         """Update a job record with new values and persist to disk.
@@ -203,6 +259,7 @@ class JobStore:
             setattr(record, k, v)
         record.updated_at = time.time()
         self._path(record.job_id).write_text(record.to_json(), encoding="utf-8")
+        _notify_job_update(record.job_id)
         return record
 
     def request_cancel(self, job_id: str) -> Optional[JobRecord]:
@@ -223,6 +280,7 @@ class JobStore:
         record.cancel_requested = True
         record.updated_at = time.time()
         self._path(job_id).write_text(record.to_json(), encoding="utf-8")
+        _notify_job_update(job_id)
         return record
 
 
@@ -1253,6 +1311,7 @@ def plan_scenes(
     additional_context: Optional[str] = None,
     references: Optional[List[Dict[str, Any]]] = None,
     model: Optional[str] = None,
+    cache: bool = False,
 ) -> Dict[str, Any]:
     """Generate a structured Gemini-authored scene plan.
 
@@ -1267,6 +1326,8 @@ def plan_scenes(
         additional_context: Extra instructions for Gemini.
         references: Optional list of character reference dicts.
         model: Gemini model override.
+        cache: Reuse an identical earlier plan from this process instead of
+            asking Gemini again.
 
     Returns:
         dict: Parsed plan payload or error structure.
@@ -1290,6 +1351,8 @@ def plan_scenes(
             kwargs["camera_angle"] = camera_angle
         if model:
             kwargs["model"] = model
+        if cache:
+            kwargs["cache"] = True
 
         plan = generate_scene_plan(idea, **kwargs)
         return json.loads(plan.model_dump_json())
@@ -135,6 +135,8 @@ def cmd_plan(ns: argparse.Namespace) -> int:
         kwargs["model"] = ns.model
     if ns.save:
         kwargs["save_path"] = ns.save
+    if ns.cache:
+        kwargs["cache"] = True
 
     plan = veo.generate_scene_plan(ns.idea, **kwargs)
 
@@ -158,6 +160,7 @@ def cmd_plan_execute(ns: argparse.Namespace) -> int:
         overlap=ns.overlap,
         auto_seed_last_frame=ns.seed_last_frame,
         seed_frame_offset=ns.seed_offset,
+        max_parallel_clips=ns.parallel,
     )
 
     if ns.json:
@@ -195,6 +198,8 @@ def cmd_plan_run(ns: argparse.Namespace) -> int:
         plan_kwargs["model"] = ns.plan_model
     if ns.save_plan:
         plan_kwargs["save_path"] = ns.save_plan
+    if ns.cache_plan:
+        plan_kwargs["cache"] = True
 
     plan = veo.generate_scene_plan(ns.idea, **plan_kwargs)
 
@@ -205,6 +210,7 @@ def cmd_plan_run(ns: argparse.Namespace) -> int:
         overlap=ns.overlap,
         auto_seed_last_frame=ns.seed_last_frame,
         seed_frame_offset=ns.seed_offset,
+        max_parallel_clips=ns.parallel,
     )
 
     if ns.json:
@@ -247,15 +253,20 @@ def cmd_continue(ns: argparse.Namespace) -> int:
                 kwargs["safety_settings"] = parsed
         except Exception:
             pass
+    source = Path(ns.video)
     gen = veo.generate_from_video(
-        video_path=Path(ns.video),
+        video_path=source,
         prompt=ns.prompt,
         extract_at=ns.extract_at,
         on_progress=_print_progress,
         **kwargs,
     )
     # Stitch with original
-    stitched = veo.stitch_videos([Path(ns.video), Path(gen.path)], overlap=ns.overlap)
+    stitched = veo.stitch_videos(
+        [source, gen.path],
+        overlap=ns.overlap,
+        reencode=ns.reencode,
+    )
     if ns.json:
         out = {
             "generated": gen.to_dict(),
@@ -315,6 +326,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     s.add_argument("--model", help="Gemini model to use (default gemini-2.5-pro)")
     s.add_argument("--save", help="Path to save the raw JSON plan")
+    s.add_argument("--cache", action="store_true", help="Reuse an identical earlier plan from this process")
     s.add_argument("--json", action="store_true", help="Output JSON to stdout")
     s.set_defaults(func=cmd_plan)
 
@@ -325,6 +337,7 @@ def build_parser() -> argparse.ArgumentParser:
     s.add_argument("--no-stitch", action="store_true", help="Skip stitching clips into a final video")
     s.add_argument("--seed-last-frame", action="store_true", help="Use the previous clip's last frame as a seed image")
     s.add_argument("--seed-offset", type=float, default=-0.5, help="Time offset (seconds) for seed frame extraction (default -0.5)")
+    s.add_argument("--parallel", type=int, default=1, help="Render up to N independent clips concurrently (default 1)")
     s.add_argument("--json", action="store_true", help="Output JSON summary")
     s.set_defaults(func=cmd_plan_execute)
 
@@ -350,11 +363,13 @@ def build_parser() -> argparse.ArgumentParser:
     )
     s.add_argument("--plan-model", help="Gemini model to use for planning (default gemini-2.5-pro)")
     s.add_argument("--save-plan", help="Optional path to save the generated plan JSON")
+    s.add_argument("--cache-plan", action="store_true", help="Reuse an identical earlier plan from this process")
     s.add_argument("--execute-model", help="Veo model to use for rendering clips")
     s.add_argument("--overlap", type=float, default=1.0, help="Overlap trim (seconds) when stitching")
     s.add_argument("--no-stitch", action="store_true", help="Skip stitching clips into a final video")
     s.add_argument("--seed-last-frame", action="store_true", help="Use the previous clip's last frame as a seed image")
     s.add_argument("--seed-offset", type=float, default=-0.5, help="Time offset (seconds) for seed frame extraction (default -0.5)")
+    s.add_argument("--parallel", type=int, default=1, help="Render up to N independent clips concurrently (default 1)")
     s.add_argument("--json", action="store_true", help="Output JSON summary including plan and execution details")
     s.set_defaults(func=cmd_plan_run)
 
@@ -364,6 +379,7 @@ def build_parser() -> argparse.ArgumentParser:
     s.add_argument("--model", help="Model ID")
     s.add_argument("--extract-at", type=float, default=-1.0)
     s.add_argument("--overlap", type=float, default=1.0)
+    s.add_argument("--reencode", action="store_true", help="Re-encode when stitching for frame-accurate trims")
     s.add_argument("--aspect-ratio", choices=["16:9","9:16"], help="Requested aspect ratio (model-dependent)")
     s.add_argument("--negative-prompt", help="Text to avoid in generation")
     s.add_argument("--person-generation", choices=["allow_all","allow_adult","dont_allow"], help="Person generation policy (model/region dependent)")
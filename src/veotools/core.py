@@ -187,11 +187,17 @@ class StorageManager:
             >>> manager.cleanup_temp()
             >>> # All temp files are now deleted
         """
-        for file in self.temp_dir.glob("*"):
-            try:
-                file.unlink()
-            except:
-                pass
+        try:
+            entries = os.scandir(self.temp_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
     
     def get_url(self, path: Path) -> Optional[str]:
         """Convert a file path to a file:// URL.
@@ -1,8 +1,10 @@
 """Video generation functions for Veo Tools."""
 
 import time
+import random
 import re
 import logging
+import threading
 import requests
 from pathlib import Path
 from typing import Optional, Callable
@@ -12,6 +14,72 @@ from ..core import VeoClient, StorageManager, ProgressTracker, ModelConfig
 from ..models import VideoResult, VideoMetadata
 from ..process.extractor import extract_frame, get_video_info
 
+# One session per thread: consecutive downloads on a thread reuse the pooled TLS
+# connection, while requests.Session itself is never shared across threads
+# (plans may render several clips concurrently).
+_http_local = threading.local()
+
+
+def _http_session() -> requests.Session:
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        session = _http_local.session = requests.Session()
+    return session
+
+
+# Operation polling backs off from a short first check (fast models can finish
+# within a minute) towards a ceiling, with jitter so parallel jobs don't align.
+_POLL_INITIAL_SECONDS = 3.0
+_POLL_MAX_SECONDS = 20.0
+_POLL_BACKOFF = 1.5
+_POLL_JITTER = 0.15
+
+
+def _wait_for_operation(
+    client,
+    operation,
+    progress: ProgressTracker,
+    *,
+    estimated_time: float,
+    label: str,
+    model: str,
+):
+    """Poll a long-running Veo operation until it completes.
+
+    Sleeps between polls with jittered exponential backoff, starting at
+    ``_POLL_INITIAL_SECONDS`` and capped at ``_POLL_MAX_SECONDS``, while reporting
+    progress against the model's estimated generation time.
+
+    Args:
+        client: Google GenAI client used to refresh the operation.
+        operation: Operation returned by the submit call.
+        progress: Tracker receiving ``"<label> <elapsed>s"`` updates.
+        estimated_time: Expected generation time in seconds for ``model``.
+        label: Verb shown in progress messages (e.g. "Generating").
+        model: Model name, used when logging the measured completion time.
+
+    Returns:
+        The completed operation.
+    """
+    start_time = time.time()
+    interval = _POLL_INITIAL_SECONDS
+
+    while not operation.done:
+        elapsed = time.time() - start_time
+        percent = min(90, int((elapsed / estimated_time) * 80) + 10)
+        progress.update(f"{label} {elapsed:.0f}s", percent)
+        time.sleep(interval * (1 + random.uniform(-_POLL_JITTER, _POLL_JITTER)))
+        interval = min(_POLL_MAX_SECONDS, interval * _POLL_BACKOFF)
+        operation = client.operations.get(operation)
+
+    logging.getLogger(__name__).info(
+        "veo: operation %s for model=%s completed in %.1fs",
+        getattr(operation, "name", None),
+        model,
+        time.time() - start_time,
+    )
+    return operation
+
 
 def _validate_person_generation(model: str, mode: str, person_generation: Optional[str]) -> None:
     """Validate person_generation parameter based on model and generation mode.
@@ -158,14 +226,14 @@ def _generate_from_text_google(
 
         model_info = ModelConfig.get_config(normalized_model)
         estimated_time = model_info["generation_time"]
-        start_time = time.time()
-
-        while not operation.done:
-            elapsed = time.time() - start_time
-            percent = min(90, int((elapsed / estimated_time) * 80) + 10)
-            progress.update(f"Generating {elapsed:.0f}s", percent)
-            time.sleep(10)
-            operation = client.operations.get(operation)
+        operation = _wait_for_operation(
+            client,
+            operation,
+            progress,
+            estimated_time=estimated_time,
+            label="Generating",
+            model=normalized_model,
+        )
 
         if operation.response and operation.response.generated_videos:
             video = operation.response.generated_videos[0].video
@@ -446,14 +514,14 @@ def _generate_from_image_google(
 
         model_info = ModelConfig.get_config(normalized_model)
         estimated_time = model_info["generation_time"]
-        start_time = time.time()
-
-        while not operation.done:
-            elapsed = time.time() - start_time
-            percent = min(90, int((elapsed / estimated_time) * 80) + 10)
-            progress.update(f"Generating {elapsed:.0f}s", percent)
-            time.sleep(10)
-            operation = client.operations.get(operation)
+        operation = _wait_for_operation(
+            client,
+            operation,
+            progress,
+            estimated_time=estimated_time,
+            label="Generating",
+            model=normalized_model,
+        )
 
         if operation.response and operation.response.generated_videos:
             video = operation.response.generated_videos[0].video
@@ -574,14 +642,14 @@ def _generate_from_video_google(
 
         model_info = ModelConfig.get_config(normalized_model)
         estimated_time = model_info["generation_time"]
-        start_time = time.time()
-
-        while not operation.done:
-            elapsed = time.time() - start_time
-            percent = min(90, int((elapsed / estimated_time) * 80) + 10)
-            progress.update(f"Generating {elapsed:.0f}s", percent)
-            time.sleep(10)
-            operation = client.operations.get(operation)
+        operation = _wait_for_operation(
+            client,
+            operation,
+            progress,
+            estimated_time=estimated_time,
+            label="Generating",
+            model=normalized_model,
+        )
 
         if operation.response and operation.response.generated_videos:
             video = operation.response.generated_videos[0].video
@@ -635,8 +703,8 @@ def _download_video(video: types.Video, output_path: Path, client) -> Path:
     """Download a generated video from Google's API to local storage.
 
     Downloads video content from either a URI or direct data blob provided by the
-    Google GenAI API. Handles authentication headers and writes the video to the
-    specified output path.
+    Google GenAI API. Handles authentication headers and streams the video to the
+    specified output path over a shared keep-alive session.
 
     Args:
         video: Video object from Google GenAI API containing URI or data.
@@ -657,27 +725,42 @@ def _download_video(video: types.Video, output_path: Path, client) -> Path:
     """
     import os
 
-    if hasattr(video, 'uri') and video.uri:
-        match = re.search(r'/files/([^:]+)', video.uri)
-        if match:
-            headers = {
-                'x-goog-api-key': os.getenv('GEMINI_API_KEY')
-            }
-            response = requests.get(video.uri, headers=headers)
-            response.raise_for_status()
+    uri = getattr(video, 'uri', None)
+    data = getattr(video, 'data', None)
 
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-
-            return output_path
+    if uri and re.search(r'/files/([^:]+)', uri):
+        headers = {
+            'x-goog-api-key': os.getenv('GEMINI_API_KEY')
+        }
+        # Stream into a sibling file so an interrupted download never leaves a
+        # truncated video at output_path
+        partial_path = output_path.with_suffix(output_path.suffix + '.part')
+        try:
+            with _http_session().get(uri, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                with open(partial_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        if chunk:
+                            f.write(chunk)
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        return output_path
 
-    elif hasattr(video, 'data') and video.data:
+    if data:
         with open(output_path, 'wb') as f:
-            f.write(video.data)
+            f.write(data)
         return output_path
 
-    else:
-        raise RuntimeError("Unable to download video - no URI or data found")
+    logger = logging.getLogger(__name__)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Video payload had no usable URI or data: type=%s uri=%r",
+            type(video).__name__,
+            uri,
+        )
+    raise RuntimeError("Unable to download video - no URI or data found")
 
 
 def extend_video(
@@ -759,14 +842,14 @@ def extend_video(
         result.operation_id = operation.name
 
         estimated_time = model_config["generation_time"]
-        start_time = time.time()
-
-        while not operation.done:
-            elapsed = time.time() - start_time
-            percent = min(90, int((elapsed / estimated_time) * 80) + 10)
-            progress.update(f"Extending {elapsed:.0f}s", percent)
-            time.sleep(10)
-            operation = veo_client.client.operations.get(operation)
+        operation = _wait_for_operation(
+            veo_client.client,
+            operation,
+            progress,
+            estimated_time=estimated_time,
+            label="Extending",
+            model=normalized_model,
+        )
 
         if operation.response and operation.response.generated_videos:
             video = operation.response.generated_videos[0].video
@@ -892,14 +975,14 @@ def generate_with_reference_images(
         result.operation_id = operation.name
 
         estimated_time = model_config["generation_time"]
-        start_time = time.time()
-
-        while not operation.done:
-            elapsed = time.time() - start_time
-            percent = min(90, int((elapsed / estimated_time) * 80) + 10)
-            progress.update(f"Generating {elapsed:.0f}s", percent)
-            time.sleep(10)
-            operation = veo_client.client.operations.get(operation)
+        operation = _wait_for_operation(
+            veo_client.client,
+            operation,
+            progress,
+            estimated_time=estimated_time,
+            label="Generating",
+            model=normalized_model,
+        )
 
         if operation.response and operation.response.generated_videos:
             video = operation.response.generated_videos[0].video
@@ -1023,14 +1106,14 @@ def generate_with_interpolation(
         result.operation_id = operation.name
 
         estimated_time = model_config["generation_time"]
-        start_time = time.time()
-
-        while not operation.done:
-            elapsed = time.time() - start_time
-            percent = min(90, int((elapsed / estimated_time) * 80) + 10)
-            progress.update(f"Interpolating {elapsed:.0f}s", percent)
-            time.sleep(10)
-            operation = veo_client.client.operations.get(operation)
+        operation = _wait_for_operation(
+            veo_client.client,
+            operation,
+            progress,
+            estimated_time=estimated_time,
+            label="Interpolating",
+            model=normalized_model,
+        )
 
         if operation.response and operation.response.generated_videos:
             video = operation.response.generated_videos[0].video
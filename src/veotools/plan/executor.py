@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Sequence
@@ -114,6 +116,7 @@ def execute_scene_plan(
     overlap: float = 1.0,
     auto_seed_last_frame: bool = False,
     seed_frame_offset: float = -0.5,
+    max_parallel_clips: int = 1,
     on_progress: Optional[Callable[[str, int], None]] = None,
 ) -> PlanExecutionResult:
     """Render all clips in a scene plan and optionally stitch the results.
@@ -128,9 +131,14 @@ def execute_scene_plan(
         overlap: Overlap trimming in seconds when stitching.
         auto_seed_last_frame: When True, extract a frame from each rendered clip and
             feed it as the seed image for the next clip (unless an image_provider
-            supplies one explicitly).
+            supplies one explicitly, in which case no frame is extracted).
         seed_frame_offset: Time offset (seconds) used when extracting the frame
             from each clip for auto seeding. Defaults to -0.5 (half a second from end).
+        max_parallel_clips: Maximum number of clips rendered concurrently when clips
+            are independent (no ``auto_seed_last_frame``). Veo calls are I/O bound, so
+            overlapping them hides polling latency, at the cost of several concurrent
+            (billed) generations. Defaults to 1, rendering sequentially. If a clip
+            fails, clips not yet started are cancelled and the error is raised.
         on_progress: Optional progress callback used for generation and stitching.
 
     Returns:
@@ -144,12 +152,7 @@ def execute_scene_plan(
 
     total_clips = len(scene_plan.clips)
 
-    last_seed_frame: Optional[Path] = None
-
-    for idx, clip in enumerate(scene_plan.clips):
-        prompt = prompt_builder(clip)
-        clip_prompts.append(prompt)
-
+    def _render(idx: int, clip: Clip, prompt: str, image_path: Optional[Path]) -> VideoResult:
         per_clip_kwargs = clip_options(clip, idx, scene_plan) if clip_options else {}
         per_clip_kwargs = dict(per_clip_kwargs or {})
         clip_model = per_clip_kwargs.pop("model", model)
@@ -165,41 +168,102 @@ def execute_scene_plan(
 
         wrapped_progress = _progress_wrapper if on_progress else None
 
-        image_path: Optional[Path] = None
-        if image_provider:
-            provided = image_provider(clip, idx, scene_plan)
-            if provided:
-                image_path = Path(provided)
-
-        if image_path is None and auto_seed_last_frame and last_seed_frame:
-            image_path = last_seed_frame
-
         if image_path:
-            result = generate_from_image(
+            return generate_from_image(
                 image_path,
                 prompt,
                 model=clip_model,
                 on_progress=wrapped_progress,
                 **per_clip_kwargs,
             )
-        else:
-            result = generate_from_text(
-                prompt,
-                model=clip_model,
-                on_progress=wrapped_progress,
-                **per_clip_kwargs,
-            )
+        return generate_from_text(
+            prompt,
+            model=clip_model,
+            on_progress=wrapped_progress,
+            **per_clip_kwargs,
+        )
 
-        clip_results.append(result)
+    provided_images: Dict[int, Optional[Path]] = {}
+
+    def _provided_image(idx: int) -> Optional[Path]:
+        # Memoised so looking ahead to the next clip doesn't call the provider twice
+        if idx not in provided_images:
+            provided = (
+                image_provider(scene_plan.clips[idx], idx, scene_plan) if image_provider else None
+            )
+            provided_images[idx] = Path(provided) if provided else None
+        return provided_images[idx]
+
+    # Clips are independent unless one waits on its predecessor's last frame,
+    # which a provided image avoids; only then are all providers called upfront.
+    parallel = (
+        max_parallel_clips > 1
+        and total_clips > 1
+        and (
+            not auto_seed_last_frame
+            or all(_provided_image(idx) is not None for idx in range(1, total_clips))
+        )
+    )
 
-        if auto_seed_last_frame and result.path and idx < total_clips - 1:
+    if not parallel:
+        last_seed_frame: Optional[Path] = None
+        for idx, clip in enumerate(scene_plan.clips):
+            prompt = prompt_builder(clip)
+            clip_prompts.append(prompt)
+
+            image_path = _provided_image(idx)
+            if image_path is None and auto_seed_last_frame and last_seed_frame:
+                image_path = last_seed_frame
+
+            result = _render(idx, clip, prompt, image_path)
+            clip_results.append(result)
+
+            last_seed_frame = None
+            if (
+                auto_seed_last_frame
+                and result.path
+                and idx < total_clips - 1
+                and _provided_image(idx + 1) is None
+            ):
+                try:
+                    last_seed_frame = extract_frame(
+                        result.path,
+                        time_offset=seed_frame_offset,
+                    )
+                except Exception:
+                    pass
+    else:
+        clip_prompts.extend(prompt_builder(clip) for clip in scene_plan.clips)
+        aborted = threading.Event()
+
+        def _render_unless_aborted(
+            idx: int, clip: Clip, prompt: str, image_path: Optional[Path]
+        ) -> Optional[VideoResult]:
+            # A worker freed by the failing clip may dequeue the next one before
+            # the pool is shut down; don't let it start a generation.
+            if aborted.is_set():
+                return None
             try:
-                last_seed_frame = extract_frame(
-                    result.path,
-                    time_offset=seed_frame_offset,
-                )
-            except Exception:
-                last_seed_frame = None
+                return _render(idx, clip, prompt, image_path)
+            except BaseException:
+                aborted.set()
+                raise
+
+        pool = ThreadPoolExecutor(max_workers=min(max_parallel_clips, total_clips))
+        futures = [
+            pool.submit(_render_unless_aborted, idx, clip, clip_prompts[idx], _provided_image(idx))
+            for idx, clip in enumerate(scene_plan.clips)
+        ]
+        try:
+            # Surface the first failure as soon as it happens rather than in plan order
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Don't start further (billed) generations once the plan has failed
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+        clip_results.extend(future.result() for future in futures)
 
     clip_paths: List[Path] = [
         result.path for result in clip_results if result.path is not None
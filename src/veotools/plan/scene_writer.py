@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from google.genai import types
-from pydantic import AnyUrl, BaseModel, Field
+from pydantic import AnyUrl, BaseModel, ConfigDict, Field, ValidationError
+from pydantic_core import from_json, to_json
 
 from ..core import VeoClient
 
@@ -43,9 +49,11 @@ class Subject(BaseModel):
 class Scene(BaseModel):
     """Describes the setting and environment of the clip."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     location: str = Field(..., description="The physical place where the scene occurs.")
     time_of_day: str = Field(
-        "mid-day", description="The time of day, which heavily influences lighting."
+        "mid-day", alias="tod", description="The time of day, which heavily influences lighting."
     )
     environment: str = Field(
         ..., description="Specific environmental details that reinforce the setting."
@@ -71,18 +79,22 @@ class Cinematography(BaseModel):
 class AudioTrack(BaseModel):
     """Defines the sound elements specific to this clip."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     lyrics: Optional[str] = Field(None, description="Lyrics to be lip-synced or heard.")
     emotion: Optional[str] = Field(None, description="Emotional tone of the vocal performance.")
     flow: Optional[str] = Field(None, description="Rhythm and cadence of the lyrical delivery.")
     wave_download_url: Optional[AnyUrl] = Field(
-        None, description="URL to a pre-existing audio file for this clip (if available)."
+        None,
+        alias="wav_url",
+        description="URL to a pre-existing audio file for this clip (if available).",
     )
     youtube_reference: Optional[AnyUrl] = Field(
-        None, description="Reference video for music or mood."
+        None, alias="yt_ref", description="Reference video for music or mood."
     )
-    audio_base64: Optional[str] = Field(None, description="Base64 encoded audio data.")
+    audio_base64: Optional[str] = Field(None, alias="b64", description="Base64 encoded audio data.")
     format: str = Field("wav", description="Desired audio format, e.g. wav or mp3.")
-    sample_rate_hz: int = Field(48000, description="Audio sample rate in Hertz.")
+    sample_rate_hz: int = Field(48000, alias="sr", description="Audio sample rate in Hertz.")
     channels: int = Field(2, description="Number of audio channels (1=mono, 2=stereo, etc.).")
     style: Optional[str] = Field(None, description="Genre/tempo/musical notes for the track.")
 
@@ -100,57 +112,72 @@ class Dialogue(BaseModel):
 class Performance(BaseModel):
     """Controls for the character's animated performance in this clip."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     mouth_shape_intensity: Optional[float] = Field(
-        None, description="How exaggerated the mouth shapes should be (0=subtle, 1=exaggerated)."
+        None,
+        alias="msi",
+        description="How exaggerated the mouth shapes should be (0=subtle, 1=exaggerated).",
     )
     eye_contact_ratio: Optional[float] = Field(
-        None, description="Percentage of time the character looks into camera."
+        None, alias="ecr", description="Percentage of time the character looks into camera."
     )
 
 
 class Clip(BaseModel):
     """Defines a single video segment or shot."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     id: str = Field(..., description="Unique identifier for this clip.")
     shot: Shot
     subject: Subject
     scene: Scene
-    visual_details: VisualDetails
-    cinematography: Cinematography
-    audio_track: AudioTrack
+    visual_details: VisualDetails = Field(..., alias="vd")
+    cinematography: Cinematography = Field(..., alias="cine")
+    audio_track: AudioTrack = Field(..., alias="audio")
     dialogue: Dialogue
-    performance: Performance
-    duration_sec: int = Field(..., description="Duration of the clip in seconds.")
+    performance: Performance = Field(..., alias="perf")
+    duration_sec: int = Field(..., alias="dur", description="Duration of the clip in seconds.")
     aspect_ratio: str = Field(
-        "16:9", description="Aspect ratio for the clip (e.g., '16:9', '9:16')."
+        "16:9", alias="ar", description="Aspect ratio for the clip (e.g., '16:9', '9:16')."
     )
 
 
 class CharacterProfile(BaseModel):
     """A detailed, consistent profile of the character's core attributes."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     name: str = Field(..., description="Primary name of the character.")
     age: int = Field(..., description="Character's apparent age.")
     height: str = Field(..., description="Character height, optionally in multiple units.")
     build: str = Field(..., description="Body type and physique description.")
-    skin_tone: str = Field(..., description="Skin tone description.")
+    skin_tone: str = Field(..., alias="skin", description="Skin tone description.")
     hair: str = Field(..., description="Hair colour, length, and style.")
     eyes: str = Field(..., description="Eye shape and colour details.")
     distinguishing_marks: Optional[str] = Field(
-        None, description="Unique features like tattoos, scars, or piercings."
+        None, alias="dm", description="Unique features like tattoos, scars, or piercings."
     )
     demeanour: str = Field(..., description="Typical personality and mood.")
-    default_outfit: str = Field(..., description="Primary outfit for the character.")
+    default_outfit: str = Field(..., alias="do", description="Primary outfit for the character.")
     mouth_shape_intensity: float = Field(
-        ..., description="Baseline mouth movement exaggeration (0=subtle, 1=exaggerated)."
+        ...,
+        alias="msi",
+        description="Baseline mouth movement exaggeration (0=subtle, 1=exaggerated).",
     )
     eye_contact_ratio: float = Field(
-        ..., description="Baseline percentage of time looking into camera."
+        ..., alias="ecr", description="Baseline percentage of time looking into camera."
     )
 
 
 class ScenePlan(BaseModel):
-    """Structured response containing characters and clips."""
+    """Structured response containing characters and clips.
+
+    Verbose fields carry short aliases (``dm``, ``msi``, ``vd``...) used in the
+    schema sent to the model to cut output tokens. Both the aliases and the full
+    field names are accepted on input; dumps use the full field names.
+    """
 
     characters: List[CharacterProfile]
     clips: List[Clip]
@@ -180,11 +207,101 @@ Return a valid JSON object that matches the supplied schema exactly.
 """
 
 
+def _compact_plan_enabled() -> bool:
+    """Return False when ``VEO_COMPACT_PLAN=0`` asks for full field names in the schema."""
+    return os.getenv("VEO_COMPACT_PLAN", "1").strip().lower() not in ("0", "false", "no")
+
+
+_PLAN_CACHE_SIZE = 64
+_PLAN_CACHE_TTL = 24 * 60 * 60
+_PLAN_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+def _plan_cache_key(provider: str, model: str, prompt: str, config: Any) -> str:
+    if isinstance(config, BaseModel):
+        config = config.model_dump(mode="json", exclude_none=True)
+    blob = "\0".join(
+        [provider, model, prompt, json.dumps(config, sort_keys=True, default=str)]
+    )
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _plan_cache_get(key: str) -> Optional[str]:
+    with _PLAN_CACHE_LOCK:
+        entry = _PLAN_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, raw = entry
+        if time.monotonic() - stored_at > _PLAN_CACHE_TTL:
+            del _PLAN_CACHE[key]
+            return None
+        _PLAN_CACHE.move_to_end(key)
+        return raw
+
+
+def _plan_cache_set(key: str, raw: str) -> None:
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE[key] = (time.monotonic(), raw)
+        _PLAN_CACHE.move_to_end(key)
+        while len(_PLAN_CACHE) > _PLAN_CACHE_SIZE:
+            _PLAN_CACHE.popitem(last=False)
+
+
+_PLAN_ARRAY_KEY = re.compile(r'"(characters|clips)"\s*:\s*\[')
+
+
+class _PlanItemScanner:
+    """Pull completed items out of a streamed plan's ``characters``/``clips`` arrays.
+
+    Each :meth:`feed` appends text and yields ``(array_name, item)`` for every
+    array element that has been fully received since the previous call.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self._pos = 0
+        self._array: Optional[str] = None
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> Iterator[tuple[str, Any]]:
+        self.buffer += text
+        while True:
+            if self._array is None:
+                match = _PLAN_ARRAY_KEY.search(self.buffer, self._pos)
+                if not match:
+                    return
+                self._array = match.group(1)
+                self._pos = match.end()
+            while self._pos < len(self.buffer) and self.buffer[self._pos] in " \t\r\n,":
+                self._pos += 1
+            if self._pos >= len(self.buffer):
+                return
+            if self.buffer[self._pos] == "]":
+                self._array = None
+                self._pos += 1
+                continue
+            try:
+                item, end = self._decoder.raw_decode(self.buffer, self._pos)
+            except json.JSONDecodeError:
+                # Element still incomplete; wait for more text
+                return
+            self._pos = end
+            yield self._array, item
+
+
 class SceneWriter:
-    """High-level helper for generating structured scene plans."""
+    """High-level helper for generating structured scene plans.
+
+    Every call asks the provider for a fresh plan by default. Pass
+    ``cache=True`` to reuse responses in-process for up to a day, keyed by
+    provider, model, prompt, and request config, so regenerating an identical
+    plan skips the model call.
+    """
 
-    def __init__(self, model: str = "gemini-2.5-pro"):
+    def __init__(self, model: str = "gemini-2.5-pro", cache: bool = False):
         self.model = model
+        self.cache = cache
         wrapper = VeoClient()
         self._provider = getattr(wrapper, "provider", "google")
         self._client = getattr(wrapper, "client", None)
@@ -288,6 +405,150 @@ class SceneWriter:
             ScenePlan: Parsed response from Gemini respecting the response_model schema.
         """
 
+        prompt, schema, request_config, target_model = self._prepare_request(
+            idea,
+            number_of_scenes=number_of_scenes,
+            additional_context=additional_context,
+            character_description=character_description,
+            character_characteristics=character_characteristics,
+            character_references=character_references,
+            video_type=video_type,
+            video_characteristics=video_characteristics,
+            camera_angle=camera_angle,
+            model=model,
+            config=config,
+            response_model=response_model,
+        )
+
+        cache_key = self._cache_key(target_model, prompt, request_config)
+        cached = _plan_cache_get(cache_key) if cache_key else None
+
+        if cached is not None:
+            raw = cached
+        elif self._provider == "daydreams":
+            raw = self._generate_plan_daydreams(prompt, schema, target_model)
+        else:
+            raw = self._generate_plan_google(prompt, request_config, target_model)
+
+        if not raw:
+            raise RuntimeError("Scene writer returned an empty response")
+
+        try:
+            plan = response_model.model_validate_json(raw)
+        except ValidationError:
+            # JSON mode returns bare JSON; only custom configs or chat providers
+            # that ignore the schema wrap it in a markdown fence.
+            unfenced = self._strip_code_fence(raw)
+            if unfenced == raw.strip():
+                raise
+            raw = unfenced
+            plan = response_model.model_validate_json(raw)
+        if cache_key and cached is None:
+            _plan_cache_set(cache_key, raw)
+
+        if save_path:
+            path = Path(save_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(plan.model_dump_json(indent=2), encoding="utf-8")
+
+        return plan
+
+    def stream(
+        self,
+        idea: str,
+        *,
+        number_of_scenes: int = 4,
+        additional_context: Optional[str] = None,
+        character_description: Optional[str] = None,
+        character_characteristics: Optional[str] = None,
+        character_references: Optional[Sequence[CharacterProfile | dict]] = None,
+        video_type: Optional[str] = None,
+        video_characteristics: Optional[str] = None,
+        camera_angle: Optional[str] = None,
+        model: Optional[str] = None,
+        config: Optional[types.GenerateContentConfig] = None,
+    ) -> Iterator[CharacterProfile | Clip]:
+        """Yield characters and clips as soon as each one has been generated.
+
+        Streams the Gemini response and parses it incrementally, so callers can
+        start working on the first character or clip while the rest of the plan
+        is still being written. Cached plans and providers without streaming
+        support are yielded from the complete plan instead.
+
+        Args:
+            idea: Core concept for the story (plain text).
+            number_of_scenes, additional_context, character_description,
+            character_characteristics, character_references, video_type,
+            video_characteristics, camera_angle, model, config: Same as
+                :meth:`generate`.
+
+        Yields:
+            CharacterProfile or Clip: Every character followed by every clip, in
+            the order the model wrote them.
+
+        Examples:
+            >>> for item in SceneWriter().stream("Rooftop vlog", number_of_scenes=3):
+            ...     print(type(item).__name__)
+        """
+
+        options: Dict[str, Any] = dict(
+            number_of_scenes=number_of_scenes,
+            additional_context=additional_context,
+            character_description=character_description,
+            character_characteristics=character_characteristics,
+            character_references=character_references,
+            video_type=video_type,
+            video_characteristics=video_characteristics,
+            camera_angle=camera_angle,
+            model=model,
+            config=config,
+        )
+        prompt, _, request_config, target_model = self._prepare_request(
+            idea, response_model=ScenePlan, **options
+        )
+        cache_key = self._cache_key(target_model, prompt, request_config)
+
+        if self._provider == "daydreams" or (cache_key and _plan_cache_get(cache_key) is not None):
+            plan = self.generate(idea, **options)
+            yield from plan.characters
+            yield from plan.clips
+            return
+
+        scanner = _PlanItemScanner()
+        item_models = {"characters": CharacterProfile, "clips": Clip}
+        for chunk in self._client.models.generate_content_stream(
+            model=target_model,
+            contents=prompt,
+            config=request_config,
+        ):
+            for key, item in scanner.feed(getattr(chunk, "text", None) or ""):
+                yield item_models[key].model_validate(item)
+
+        if not scanner.buffer:
+            raise RuntimeError("Scene writer returned an empty response")
+        if cache_key:
+            try:
+                ScenePlan.model_validate_json(scanner.buffer)
+            except ValidationError:
+                return
+            _plan_cache_set(cache_key, scanner.buffer)
+
+    def _prepare_request(
+        self,
+        idea: str,
+        *,
+        number_of_scenes: int,
+        additional_context: Optional[str],
+        character_description: Optional[str],
+        character_characteristics: Optional[str],
+        character_references: Optional[Sequence[CharacterProfile | dict]],
+        video_type: Optional[str],
+        video_characteristics: Optional[str],
+        camera_angle: Optional[str],
+        model: Optional[str],
+        config: Optional[types.GenerateContentConfig],
+        response_model: type[ScenePlan],
+    ) -> tuple[str, Dict[str, Any], Any, str]:
         optional_inputs, custom_guidance = self._build_prompt_sections(
             character_description=character_description,
             character_characteristics=character_characteristics,
@@ -305,29 +566,28 @@ class SceneWriter:
             custom_guidance=custom_guidance,
         )
 
-        schema = response_model.model_json_schema()
+        compact = _compact_plan_enabled()
+        schema = response_model.model_json_schema(by_alias=compact)
+        if compact:
+            prompt += (
+                "Use the short property names from the schema exactly as given, and "
+                "omit optional properties that would be null or equal their default.\n"
+            )
+        target_model = model or self.model
 
         if self._provider == "daydreams":
-            raw = self._generate_plan_daydreams(prompt, schema, model or self.model)
+            request_config: Any = schema
         else:
             request_config = config or types.GenerateContentConfig(
                 response_mime_type="application/json",
                 response_json_schema=schema,
             )
-            raw = self._generate_plan_google(prompt, request_config, model or self.model)
-
-        if not raw:
-            raise RuntimeError("Scene writer returned an empty response")
-
-        plan = response_model.model_validate_json(raw)
-
-        if save_path:
-            path = Path(save_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(plan.model_dump_json(indent=2), encoding="utf-8")
-
-        return plan
+        return prompt, schema, request_config, target_model
 
+    def _cache_key(self, model: str, prompt: str, request_config: Any) -> Optional[str]:
+        if not self.cache:
+            return None
+        return _plan_cache_key(self._provider, model, prompt, request_config)
 
     def _generate_plan_google(
         self,
@@ -384,15 +644,21 @@ class SceneWriter:
         if not content or not isinstance(content, str):
             raise RuntimeError("Daydreams Router response did not include textual content")
 
-        normalized = self._strip_code_fence(content)
+        # pydantic-core's parser is the same Rust code model_validate_json uses,
+        # several times faster than the stdlib json module on multi-KB plans.
+        normalized = content.strip()
         try:
-            data = json.loads(normalized)
-        except json.JSONDecodeError:
-            return normalized
+            data = from_json(normalized)
+        except ValueError:
+            normalized = self._strip_code_fence(normalized)
+            try:
+                data = from_json(normalized)
+            except ValueError:
+                return normalized
 
         if isinstance(data, dict) and "characters" not in data and data.get("video_prompts"):
             converted = self._coerce_video_prompts(data["video_prompts"])
-            return json.dumps(converted)
+            return to_json(converted).decode("utf-8")
 
         return normalized
 
@@ -513,10 +779,14 @@ def generate_scene_plan(
     camera_angle: Optional[str] = None,
     model: str = "gemini-2.5-pro",
     save_path: Optional[Path | str] = None,
+    cache: bool = False,
 ) -> ScenePlan:
-    """Convenience wrapper around :class:`SceneWriter` for one-off calls."""
+    """Convenience wrapper around :class:`SceneWriter` for one-off calls.
+
+    Set ``cache=True`` to reuse an identical earlier response from this process.
+    """
 
-    writer = SceneWriter(model=model)
+    writer = SceneWriter(model=model, cache=cache)
     return writer.generate(
         idea,
         number_of_scenes=number_of_scenes,
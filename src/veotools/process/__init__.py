@@ -1,5 +1,5 @@
 """Video processing module for Veo Tools."""
 
-from .extractor import extract_frame, extract_frames, get_video_info
+from .extractor import extract_frame, extract_frames, get_video_info, get_video_info_batch
 
-__all__ = ["extract_frame", "extract_frames", "get_video_info"]
\ No newline at end of file
+__all__ = ["extract_frame", "extract_frames", "get_video_info", "get_video_info_batch"]
\ No newline at end of file
@@ -4,16 +4,65 @@ Enhancements:
 - `get_video_info` now first attempts to use `ffprobe` for accurate metadata
   (fps, duration, width, height). If `ffprobe` is unavailable, it falls back
   to OpenCV-based probing.
+- Captures are opened through OpenCV's FFmpeg backend with hardware decode
+  requested (``VIDEO_ACCELERATION_ANY``); OpenCV silently falls back to
+  software decoding when no accelerator is available.
+- `get_video_info` results are memoised per ``(path, mtime, size)``, so repeated
+  lookups of an unchanged file skip both ffprobe and OpenCV.
+- `get_video_info_batch` probes many files at once, sharing one worker pool and
+  skipping duplicate paths, for listings that would otherwise probe serially.
 """
 
 import cv2
+import functools
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from ..core import StorageManager
 
+_JPEG_QUALITY = 90
+# Gaps longer than this between requested frames are crossed with a fresh seek
+# instead of decoding every frame in between.
+_RESEEK_AFTER_SECONDS = 10.0
+
+
+def _open_capture(video_path: Path) -> cv2.VideoCapture:
+    """Open a capture preferring hardware decode, falling back to the default backend."""
+    cap = cv2.VideoCapture(
+        str(video_path),
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    if cap.isOpened():
+        return cap
+    cap.release()
+    return cv2.VideoCapture(str(video_path))
+
+
+def _write_frame(output_path: Path, frame, quality: int = _JPEG_QUALITY) -> bool:
+    """Encode ``frame`` in memory and write it with one unbuffered syscall.
+
+    The image format follows the file suffix like ``cv2.imwrite`` (JPEG when
+    there is none); ``quality`` applies to JPEG only.
+    """
+    ext = Path(output_path).suffix.lower() or ".jpg"
+    params = [cv2.IMWRITE_JPEG_QUALITY, quality] if ext in (".jpg", ".jpeg") else []
+    ok, encoded = cv2.imencode(ext, frame, params)
+    if not ok:
+        return False
+    view = memoryview(encoded).cast("B")
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
 
 def extract_frame(
     video_path: Path,
@@ -61,7 +110,7 @@ def extract_frame(
         raise FileNotFoundError(f"Video not found: {video_path}")
     
     storage = StorageManager()
-    cap = cv2.VideoCapture(str(video_path))
+    cap = _open_capture(video_path)
     
     try:
         fps = cap.get(cv2.CAP_PROP_FPS)
@@ -85,7 +134,9 @@ def extract_frame(
             filename = f"frame_{video_path.stem}_at_{target_time:.1f}s.jpg"
             output_path = storage.get_frame_path(filename)
         
-        cv2.imwrite(str(output_path), frame)
+        # 95 matches what cv2.imwrite used by default for single frames
+        if not _write_frame(output_path, frame, quality=95):
+            raise RuntimeError(f"Failed to encode frame for {output_path}")
         
         return output_path
         
@@ -101,8 +152,10 @@ def extract_frames(
     """Extract multiple frames from a video at specified time offsets.
 
     Extracts and saves multiple frames from a video file as JPEG images. Each
-    time offset can be positive (from start) or negative (from end). Uses
-    OpenCV for efficient batch frame extraction.
+    time offset can be positive (from start) or negative (from end). Requested
+    times are visited in ascending order with a single seek followed by a
+    forward decode, so nearby timestamps share one pass over the GOP. JPEG
+    encoding runs on a thread pool so it overlaps with decoding.
 
     Args:
         video_path: Path to the input video file.
@@ -142,7 +195,7 @@ def extract_frames(
         raise FileNotFoundError(f"Video not found: {video_path}")
     
     storage = StorageManager()
-    cap = cv2.VideoCapture(str(video_path))
+    cap = _open_capture(video_path)
     frames = []
     
     try:
@@ -150,27 +203,50 @@ def extract_frames(
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         duration = total_frames / fps if fps > 0 else 0
         
+        targets = []
         for i, time_offset in enumerate(times):
             if time_offset < 0:
                 target_time = max(0, duration + time_offset)
             else:
                 target_time = min(duration, time_offset)
-            
-            target_frame = int(target_time * fps)
-            
-            cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-            ret, frame = cap.read()
-            
-            if ret:
+            targets.append((int(target_time * fps), i, target_time))
+        targets.sort()
+
+        max_gap = int(_RESEEK_AFTER_SECONDS * fps)
+        pending = {}
+        current = -1
+        frame = None
+        workers = max(1, min(len(targets), os.cpu_count() or 1))
+        # cv2 releases the GIL while encoding, so writes overlap with decoding.
+        # cap.read() allocates a fresh array per call, so no copy is needed.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for target_frame, i, target_time in targets:
+                if frame is None or target_frame - current > max_gap:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
+                    current = target_frame - 1
+                ret = True
+                # grab() demuxes and decodes without the colour conversion and
+                # array copy that retrieve() adds; only the target frame needs them.
+                while ret and current < target_frame - 1:
+                    ret = cap.grab()
+                    current += 1
+                if ret and current < target_frame:
+                    ret, frame = cap.read()
+                    current += 1
+                if not ret:
+                    # Targets are sorted, so every remaining one lies past this failure
+                    break
+
                 if output_dir:
                     output_path = output_dir / f"frame_{i:03d}_at_{target_time:.1f}s.jpg"
                 else:
                     filename = f"frame_{video_path.stem}_{i:03d}_at_{target_time:.1f}s.jpg"
                     output_path = storage.get_frame_path(filename)
-                
-                cv2.imwrite(str(output_path), frame)
-                frames.append(output_path)
-        
+
+                future = pool.submit(_write_frame, output_path, frame)
+                pending[i] = (output_path, future)
+
+        frames = [path for i, (path, future) in sorted(pending.items()) if future.result()]
         return frames
         
     finally:
@@ -218,10 +294,69 @@ def get_video_info(video_path: Path) -> dict:
         - OpenCV fallback may have slight inaccuracies in frame rate calculation
         - All numeric values are guaranteed to be non-negative
         - Returns 0.0 for fps/duration if video properties cannot be determined
+        - Results are cached until the file's modification time or size changes
     """
     if not video_path.exists():
         raise FileNotFoundError(f"Video not found: {video_path}")
 
+    stat = video_path.stat()
+    return dict(_probe(str(video_path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+def get_video_info_batch(video_paths: Sequence[Path], max_workers: int = 8) -> List[dict]:
+    """Extract metadata for several videos, probing cache misses in parallel.
+
+    ffprobe only accepts a single input per invocation, so the batch cannot share
+    one process. Instead each distinct file is probed at most once, unchanged
+    files are served from the :func:`get_video_info` cache, and the remaining
+    ffprobe runs overlap on a bounded thread pool.
+
+    Args:
+        video_paths: Videos to inspect. Duplicates are probed once.
+        max_workers: Maximum number of concurrent probes.
+
+    Returns:
+        List[dict]: Metadata in the same order as ``video_paths``, in the format
+            returned by :func:`get_video_info`. Missing or unreadable files yield
+            an empty dict rather than raising.
+
+    Examples:
+        >>> infos = get_video_info_batch([Path("a.mp4"), Path("b.mp4")])
+        >>> total = sum(info.get("duration", 0.0) for info in infos)
+    """
+    keys: List[Optional[tuple]] = []
+    for video_path in video_paths:
+        try:
+            stat = video_path.stat()
+            keys.append((str(video_path.resolve()), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            keys.append(None)
+
+    def _safe_probe(key: tuple) -> dict:
+        try:
+            return _probe(*key)
+        except Exception:
+            return {}
+
+    unique = list(dict.fromkeys(key for key in keys if key is not None))
+    if len(unique) <= 1 or max_workers <= 1:
+        probed = {key: _safe_probe(key) for key in unique}
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+            probed = dict(zip(unique, pool.map(_safe_probe, unique)))
+    return [dict(probed[key]) if key is not None else {} for key in keys]
+
+
+# Large enough that a full-size listing (up to 1000 videos) plus stitch probes
+# fit, so repeat listings don't evict their own entries before reuse.
+_PROBE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_PROBE_CACHE_SIZE)
+def _probe(path: str, mtime_ns: int, size: int) -> dict:
+    """Probe ``path`` once per ``(mtime_ns, size)``; callers must copy the result."""
+    video_path = Path(path)
+
     # Try ffprobe for precise metadata
     try:
         cmd = [
@@ -279,7 +414,7 @@ def get_video_info(video_path: Path) -> dict:
         pass
 
     # Fallback: OpenCV probing
-    cap = cv2.VideoCapture(str(video_path))
+    cap = _open_capture(video_path)
     try:
         fps = cap.get(cv2.CAP_PROP_FPS)
         frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
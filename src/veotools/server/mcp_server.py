@@ -2,32 +2,228 @@
 
 Run:
   veo-mcp            # via console script
+  veo-mcp --no-warm  # skip background metadata warm-up (e.g. in tests)
   python -m veotools.mcp_server
 """
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import copy
+import functools
+import heapq
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Optional, List, Dict
 
 from mcp.server.fastmcp import FastMCP, Context
 import veotools as veo
-from veotools.process.extractor import get_video_info
-from veotools.api.mcp_api import JobStore
+from veotools.process.extractor import get_video_info_batch
+from veotools.stitch.seamless import prefetch_stitch_metadata
+from veotools.api.mcp_api import JobStore, subscribe_job_updates
 
 
 app = FastMCP("veotools")
 
+# Job status polling starts fast so quick jobs return promptly, then backs off
+# while nothing changes so long jobs don't hammer the JobStore. In-process job
+# updates wake the poller immediately; polling only covers out-of-process writers.
+_POLL_INITIAL_SECONDS = 0.05
+_POLL_MAX_SECONDS = 2.0
+_POLL_BACKOFF = 1.7
+_TERMINAL_STATUSES = frozenset(("complete", "failed", "cancelled"))
+# Streaming clients beyond this get an immediate snapshot instead of waiting.
+_MAX_STREAMING_CLIENTS = 256
+# ffprobe takes one input per process; bound how many run at once on cold listings.
+_PROBE_CONCURRENCY = 8
+# Upper bounds on client-supplied sizes so one request can't pin a poller for
+# hours or probe an entire archive.
+_MAX_LIST_LIMIT = 1000
+_MAX_WAIT_MS = 900_000
+# Startup warm-up probes this many of the newest videos, a couple at a time, so
+# it stays in the background of real requests.
+_WARM_VIDEO_COUNT = 500
+_WARM_CONCURRENCY = 2
+# preflight shells out to ffmpeg and probes the filesystem; reuse results briefly.
+_PREFLIGHT_TTL_SECONDS = 5.0
+
+
+@functools.lru_cache(maxsize=4)
+def _storage_for(output_dir: Optional[str]) -> veo.StorageManager:
+    return veo.StorageManager()
+
+
+@functools.lru_cache(maxsize=4)
+def _job_store_for(output_dir: Optional[str]) -> JobStore:
+    return JobStore(_storage_for(output_dir))
+
+
+def _storage() -> veo.StorageManager:
+    """Shared StorageManager, rebuilt only when ``VEO_OUTPUT_DIR`` changes."""
+    return _storage_for(os.getenv("VEO_OUTPUT_DIR"))
+
+
+def _job_store() -> JobStore:
+    """Shared JobStore over :func:`_storage`."""
+    return _job_store_for(os.getenv("VEO_OUTPUT_DIR"))
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_preflight(bucket: int) -> dict:
+    return veo.preflight()
+
+
+def _clamp(value: Optional[int], upper: int) -> int:
+    """Coerce a client-supplied count into ``[0, upper]``."""
+    return max(0, min(upper, int(value or 0)))
+
+
+async def _veo_get(job_id: str) -> dict:
+    """Read job status without blocking the event loop on JobStore file I/O."""
+    return await asyncio.to_thread(veo.generate_get, job_id)
+
+
+class _JobPoller:
+    """Single status poller shared by every client streaming the same job.
+
+    Each observed change of status or progress bumps ``version`` and sets the
+    current ``changed`` event, which is then swapped for a fresh one so waiters
+    can block until the next change.
+    """
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.status: Optional[dict] = None
+        self.error: Optional[Exception] = None
+        self.version = 0
+        self.changed = asyncio.Event()
+        self.clients = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def _publish(self, status: Optional[dict]) -> None:
+        self.status = status
+        self.version += 1
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        updated = asyncio.Event()
+
+        def _on_update(updated_id: str) -> None:
+            if updated_id == self.job_id:
+                loop.call_soon_threadsafe(updated.set)
+
+        unsubscribe = subscribe_job_updates(_on_update)
+        try:
+            interval = _POLL_INITIAL_SECONDS
+            while True:
+                # Clear before reading so a write landing mid-read still wakes the wait
+                updated.clear()
+                status = await _veo_get(self.job_id)
+                last = self.status or {}
+                if (
+                    self.status is None
+                    or status.get("status") != last.get("status")
+                    or int(status.get("progress", 0)) != int(last.get("progress", 0))
+                ):
+                    interval = _POLL_INITIAL_SECONDS
+                    self._publish(status)
+                else:
+                    interval = min(interval * _POLL_BACKOFF, _POLL_MAX_SECONDS)
+                if status.get("status") in _TERMINAL_STATUSES:
+                    return
+                try:
+                    await asyncio.wait_for(updated.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+        except Exception as exc:
+            # Hand read failures to the waiting clients instead of stalling them
+            self.error = exc
+            self._publish(self.status)
+        finally:
+            unsubscribe()
+
+
+_job_pollers: Dict[str, _JobPoller] = {}
+_streaming_clients = 0
+
+
+async def _stream_job(
+    job_id: str,
+    ctx: Context,
+    deadline: float,
+    default_message: str = "",
+) -> Optional[dict]:
+    """Report job progress to ``ctx`` until the job ends or ``deadline`` passes.
+
+    ``deadline`` is a ``time.monotonic()`` timestamp. All clients streaming one
+    job share a single :class:`_JobPoller`, started by the first client and
+    stopped when the last one leaves. Returns the terminal status, or None if
+    the deadline elapsed first or too many clients are already streaming.
+    """
+    global _streaming_clients
+    if _streaming_clients >= _MAX_STREAMING_CLIENTS:
+        return None
+
+    poller = _job_pollers.get(job_id)
+    if poller is None:
+        poller = _job_pollers[job_id] = _JobPoller(job_id)
+        poller.task = asyncio.create_task(poller.run())
+    poller.clients += 1
+    _streaming_clients += 1
+    try:
+        seen = 0
+        last_progress = -1
+        while True:
+            if poller.version == seen:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(poller.changed.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return None
+                continue
+            seen = poller.version
+            if poller.error is not None:
+                raise poller.error
+            status = poller.status or {}
+            progress = int(status.get("progress", 0))
+            if progress != last_progress:
+                last_progress = progress
+                try:
+                    await ctx.report_progress(
+                        progress=progress / 100.0,
+                        total=1.0,
+                        message=status.get("message", default_message),
+                    )
+                except Exception:
+                    pass
+            if status.get("status") in _TERMINAL_STATUSES:
+                return status
+    finally:
+        _streaming_clients -= 1
+        poller.clients -= 1
+        if poller.clients == 0:
+            if _job_pollers.get(job_id) is poller:
+                del _job_pollers[job_id]
+            if poller.task is not None:
+                poller.task.cancel()
+
 
 @app.tool()
 def preflight() -> dict:
     """Check environment and system prerequisites.
 
     Returns a JSON dict with: ok, provider, api_key_present, ffmpeg {installed, version},
-    write_permissions, base_path.
+    write_permissions, base_path. Results are reused for a few seconds.
     """
-    return veo.preflight()
+    return copy.deepcopy(_cached_preflight(int(time.monotonic() // _PREFLIGHT_TTL_SECONDS)))
 
 
 @app.tool()
@@ -93,8 +289,13 @@ def plan_scenes(
     camera_angle: str | None = None,
     additional_context: str | None = None,
     model: str | None = None,
+    cache: bool = False,
 ) -> dict:
-    """Generate a structured Gemini-authored scene plan."""
+    """Generate a structured Gemini-authored scene plan.
+
+    - cache: reuse an identical earlier plan from this server process instead of
+      asking Gemini again (default false, always a fresh plan).
+    """
     kwargs: Dict[str, object] = {"number_of_scenes": number_of_scenes}
     if character_description:
         kwargs["character_description"] = character_description
@@ -110,6 +311,8 @@ def plan_scenes(
         kwargs["additional_context"] = additional_context
     if model:
         kwargs["model"] = model
+    if cache:
+        kwargs["cache"] = True
     plan = veo.generate_scene_plan(
         idea,
         **kwargs,
@@ -157,28 +360,17 @@ async def generate_get(job_id: str, ctx: Context, wait_ms: int | None = None) ->
 
     - job_id: identifier from generate_start
     - wait_ms: if provided, stream progress events and return when terminal or
-      time window elapses. Use 0/None for immediate snapshot.
+      time window elapses (capped at 15 min). Use 0/None for immediate snapshot.
     Returns latest job status; includes result when complete.
     """
-    if not wait_ms or wait_ms <= 0:
-        return veo.generate_get(job_id)
-    import time
-
-    deadline = time.time() + (wait_ms / 1000.0)
-    last_progress = -1
-    while time.time() < deadline:
-        status = veo.generate_get(job_id)
-        progress = int(status.get("progress", 0))
-        if progress != last_progress:
-            last_progress = progress
-            try:
-                await ctx.report_progress(progress=progress / 100.0, total=1.0, message=status.get("message", ""))
-            except Exception:
-                pass
-        if status.get("status") in {"complete", "failed", "cancelled"}:
-            return status
-        await ctx.sleep(0.5)
-    return veo.generate_get(job_id)
+    wait_ms = _clamp(wait_ms, _MAX_WAIT_MS)
+    status = await _veo_get(job_id)
+    # Finished jobs (and plain snapshots) need no poller or progress events
+    if not wait_ms or status.get("status") in _TERMINAL_STATUSES:
+        return status
+
+    status = await _stream_job(job_id, ctx, time.monotonic() + wait_ms / 1000.0)
+    return status if status is not None else await _veo_get(job_id)
 
 
 @app.tool()
@@ -187,51 +379,93 @@ def generate_cancel(job_id: str) -> dict:
     return veo.generate_cancel(job_id)
 
 
+def _newest_videos(videos_dir: Path, limit: int) -> List[tuple]:
+    """Return ``(path, stat)`` for the newest ``limit`` MP4s in ``videos_dir``."""
+    # One scandir pass; is_file() uses the cached dirent type and stat() is the
+    # only syscall per entry, reused for both ranking and "modified". The heap
+    # keeps only the newest ``limit`` entries, however large the directory.
+    # Scanning with a bytes path keeps names undecoded until they are returned.
+    try:
+        with os.scandir(os.fsencode(videos_dir)) as it:
+            entries = heapq.nlargest(
+                limit,
+                (
+                    (entry.name, entry.stat())
+                    for entry in it
+                    if entry.name.endswith(b".mp4") and entry.is_file()
+                ),
+                key=lambda entry: entry[1].st_mtime_ns,
+            )
+    except FileNotFoundError:
+        # The shared manager created the directory once; it may since have been removed
+        return []
+    return [(videos_dir / os.fsdecode(name), st) for name, st in entries]
+
+
+def _video_entry(storage: veo.StorageManager, path: Path, st: os.stat_result, info: dict) -> dict:
+    return {
+        "path": str(path),
+        "url": storage.get_url(path),
+        "metadata": info,
+        "modified": st.st_mtime,
+    }
+
+
 @app.resource("videos://recent/{limit}")
-def list_recent_videos(limit: int = 10) -> list[dict]:
+async def list_recent_videos(limit: int = 10) -> list[dict]:
     """List recent generated videos with URLs and metadata.
 
-    - limit: max items (default 10).
+    - limit: max items (default 10, at most 1000).
     Returns array of {path, url, metadata, modified}.
     """
-    storage = veo.StorageManager()
-    files = sorted(storage.videos_dir.glob("*.mp4"), key=lambda p: p.stat().st_mtime, reverse=True)[: max(0, int(limit))]
-    out: list[dict] = []
-    for p in files:
+    storage = _storage()
+    entries = _newest_videos(storage.videos_dir, _clamp(limit, _MAX_LIST_LIMIT))
+    # Memoised per (path, mtime, size), so unchanged files skip ffprobe entirely
+    infos = await asyncio.to_thread(
+        get_video_info_batch, [p for p, _ in entries], _PROBE_CONCURRENCY
+    )
+    return [_video_entry(storage, p, st, info) for (p, st), info in zip(entries, infos)]
+
+
+@app.tool()
+async def list_recent_videos_stream(ctx: Context, limit: int = 10) -> list[dict]:
+    """List recent videos, reporting each one as soon as its metadata is ready.
+
+    - limit: max items (default 10, at most 1000).
+    Emits a progress event per video (message = its path) in completion order,
+    so clients can render entries before the slowest ffprobe finishes.
+    Returns the same array as videos://recent/{limit}, newest first.
+    """
+    storage = _storage()
+    entries = _newest_videos(storage.videos_dir, _clamp(limit, _MAX_LIST_LIMIT))
+    probes = asyncio.Semaphore(_PROBE_CONCURRENCY)
+
+    async def _probe(idx: int, path: Path, st: os.stat_result) -> tuple:
+        async with probes:
+            (info,) = await asyncio.to_thread(get_video_info_batch, [path], 1)
+        return idx, _video_entry(storage, path, st, info)
+
+    listing: List[Optional[dict]] = [None] * len(entries)
+    tasks = [_probe(idx, p, st) for idx, (p, st) in enumerate(entries)]
+    for done, future in enumerate(asyncio.as_completed(tasks), start=1):
+        idx, item = await future
+        listing[idx] = item
         try:
-            info = get_video_info(p)
+            await ctx.report_progress(progress=done, total=len(entries), message=item["path"])
         except Exception:
-            info = {}
-        out.append({
-            "path": str(p),
-            "url": storage.get_url(p),
-            "metadata": info,
-            "modified": p.stat().st_mtime,
-        })
-    return out
+            pass
+    return listing
 
 
 @app.resource("job://{job_id}")
 def get_job(job_id: str) -> dict:
     """Retrieve the persisted job record by id."""
-    store = JobStore()
-    record = store.read(job_id)
-    if not record:
+    record = _job_store().read_dict(job_id)
+    if record is None:
         return {"error_code": "VALIDATION", "error_message": f"job_id not found: {job_id}"}
-    return {
-        "job_id": record.job_id,
-        "status": record.status,
-        "progress": record.progress,
-        "message": record.message,
-        "kind": record.kind,
-        "result": record.result,
-        "error_code": record.error_code,
-        "error_message": record.error_message,
-        "remote_operation_id": record.remote_operation_id,
-        "created_at": record.created_at,
-        "updated_at": record.updated_at,
-        "cancel_requested": record.cancel_requested,
-    }
+    # The stored JSON is already the response; only generation params stay private
+    record.pop("params", None)
+    return record
 
 
 @app.tool()
@@ -246,6 +480,7 @@ async def continue_video(
     aspect_ratio: Optional[str] = None,
     negative_prompt: Optional[str] = None,
     person_generation: Optional[str] = None,
+    allow_reencode: bool = True,
 ) -> dict:
     """Generate a continuation and stitch with the source clip.
 
@@ -255,10 +490,13 @@ async def continue_video(
       - model: Veo model id (optional)
       - extract_at: seconds offset for frame extraction (default -1.0 = last second)
       - overlap: seconds to trim from end of source before concatenation (default 1.0)
-      - wait_ms: max time to stream progress before returning snapshot (default 15 min)
+      - wait_ms: max time to stream progress before returning snapshot (default and
+        maximum 15 min)
       - aspect_ratio: requested AR (e.g., "16:9"; Veo 2 also supports "9:16")
       - negative_prompt: text to avoid
       - person_generation: policy value (allow_all|allow_adult|dont_allow)
+      - allow_reencode: when false, only a stream-copy join is attempted and the
+        stitch stage fails if the clips' streams differ (default true)
     Returns {stage, generated?, stitched?}.
     """
     params: Dict = {"prompt": prompt, "input_video_path": video_path, "extract_at": extract_at}
@@ -275,45 +513,72 @@ async def continue_video(
     if options:
         params["options"] = options
 
-    start = veo.generate_start(params)
+    wait_ms = _clamp(wait_ms, _MAX_WAIT_MS)
+    start = await asyncio.to_thread(veo.generate_start, params)
     job_id = start["job_id"]
-
-    # stream progress
-    import time
-    deadline = time.time() + (wait_ms / 1000.0)
-    last_progress = -1
-    while time.time() < deadline:
-        status = veo.generate_get(job_id)
-        prog = int(status.get("progress", 0))
-        if prog != last_progress:
-            last_progress = prog
-            try:
-                await ctx.report_progress(progress=prog / 100.0, total=1.0, message=status.get("message", "Generating"))
-            except Exception:
-                pass
-        if status.get("status") in {"complete", "failed", "cancelled"}:
-            gen_result = status
-            break
-        await ctx.sleep(0.5)
-    else:
-        return {"stage": "generation", **veo.generate_get(job_id)}
-
-    if gen_result.get("status") != "complete" or not gen_result.get("result"):
-        return {"stage": "generation", **gen_result}
-
-    new_clip_path = gen_result["result"].get("path")
-    if not new_clip_path:
-        return {"stage": "generation", "error_code": "UNKNOWN", "error_message": "Missing result path"}
-
+    # Probe the source clip for stitching while Veo renders the continuation
+    source = Path(video_path)
+    prefetch = asyncio.create_task(asyncio.to_thread(prefetch_stitch_metadata, source))
+    # Every path below either awaits the prefetch or cancels it on the way
+    # out, so no probe task outlives the call.
     try:
-        stitched = veo.stitch_videos([Path(video_path), Path(new_clip_path)], overlap=overlap)
-    except Exception as e:
-        return {"stage": "stitch", "error_code": "STITCH", "error_message": str(e)}
-
-    return {"stage": "complete", "generated": gen_result["result"], "stitched": stitched.to_dict()}
-
-
-def main() -> None:
+        try:
+            gen_result = await _stream_job(
+                job_id, ctx, time.monotonic() + wait_ms / 1000.0, default_message="Generating"
+            )
+        except asyncio.CancelledError:
+            # The client went away: stop the Veo job rather than finishing and
+            # stitching a clip nobody will collect. Shielded so the cancel request
+            # still lands if the server is shutting down around us.
+            await asyncio.shield(asyncio.to_thread(veo.generate_cancel, job_id))
+            raise
+        if gen_result is None:
+            return {"stage": "generation", **(await _veo_get(job_id))}
+
+        if gen_result.get("status") != "complete" or not gen_result.get("result"):
+            return {"stage": "generation", **gen_result}
+
+        new_clip_path = gen_result["result"].get("path")
+        if not new_clip_path:
+            return {"stage": "generation", "error_code": "UNKNOWN", "error_message": "Missing result path"}
+
+        await prefetch
+        try:
+            stitched = await asyncio.to_thread(
+                veo.stitch_videos,
+                [source, Path(new_clip_path)],
+                overlap=overlap,
+                allow_reencode=allow_reencode,
+            )
+        except Exception as e:
+            return {"stage": "stitch", "error_code": "STITCH", "error_message": str(e)}
+
+        return {"stage": "complete", "generated": gen_result["result"], "stitched": stitched.to_dict()}
+    finally:
+        if not prefetch.done():
+            prefetch.cancel()
+
+
+def _warm_video_info() -> None:
+    """Populate the get_video_info cache for the newest videos; never raises."""
+    try:
+        entries = _newest_videos(_storage().videos_dir, _WARM_VIDEO_COUNT)
+        get_video_info_batch([p for p, _ in entries], _WARM_CONCURRENCY)
+    except Exception:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="veo-mcp", description="Veotools MCP server (stdio)")
+    parser.add_argument(
+        "--no-warm",
+        action="store_true",
+        help="Skip probing recent videos in the background at startup",
+    )
+    ns = parser.parse_args(argv)
+    if not ns.no_warm:
+        # Daemon thread: it only fills caches, so it must never delay shutdown
+        threading.Thread(target=_warm_video_info, name="veo-mcp-warm", daemon=True).start()
     app.run(transport="stdio")
 
 
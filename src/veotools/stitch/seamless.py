@@ -2,16 +2,39 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Callable, List, Optional, Tuple
 
 from ..core import StorageManager, ProgressTracker
 from ..models import VideoResult, VideoMetadata
 from ..process.extractor import get_video_info
 
 
+def _cached_per_file(fn: Callable) -> Callable:
+    """Memoise a single-path probe until the file's mtime or size changes."""
+
+    @functools.lru_cache(maxsize=256)
+    def _cached(path: str, mtime_ns: int, size: int):
+        return fn(Path(path))
+
+    @functools.wraps(fn)
+    def wrapper(video_path: Path):
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            return fn(video_path)
+        return _cached(os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
+
+    wrapper.cache_clear = _cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+@_cached_per_file
 def _has_audio(video_path: Path) -> bool:
     """Return True if the media file contains an audio stream."""
 
@@ -37,18 +60,257 @@ def _has_audio(video_path: Path) -> bool:
         return False
 
 
+_SOFTWARE_H264 = ["-c:v", "libx264", "-preset", "fast", "-crf", "21"]
+# Hardware encoders in preference order, with settings roughly matching CRF 21.
+_HARDWARE_H264 = {
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p5", "-rc", "vbr", "-cq", "21", "-b:v", "0"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-q:v", "65"],
+    "h264_qsv": ["-c:v", "h264_qsv", "-global_quality", "21"],
+}
+
+
+# Set once a listed hardware encoder fails where libx264 then succeeds, e.g. a
+# static ffmpeg build advertising NVENC on a machine without a GPU.
+_hardware_h264_unusable = False
+
+
+def _mark_hardware_h264_unusable() -> None:
+    global _hardware_h264_unusable
+    _hardware_h264_unusable = True
+
+
+@functools.lru_cache(maxsize=1)
+def _hardware_h264_args() -> Optional[List[str]]:
+    """Return encoder args for the first hardware H.264 encoder ffmpeg offers.
+
+    Only the ``ffmpeg -encoders`` probe is cached; callers check
+    ``VEO_HW_ENCODE`` on every stitch.
+    """
+
+    try:
+        res = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    available = {line.split()[1] for line in res.stdout.splitlines() if len(line.split()) > 1}
+    for name, args in _HARDWARE_H264.items():
+        if name in available:
+            return args
+    return None
+
+
+@_cached_per_file
+def _keyframes(video_path: Path) -> Tuple[Tuple[float, int], ...]:
+    """Return ``(pts_time, packets_before)`` for each video keyframe.
+
+    ``packets_before`` counts the video packets that precede the keyframe in
+    decode order, i.e. the frames kept when cutting just before it. Reads packet
+    flags rather than decoding frames, so this stays cheap even for long clips.
+    Returns an empty tuple if ffprobe is unavailable or fails.
+    """
+
+    try:
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "packet=pts_time,flags",
+            "-of",
+            "json",
+            str(video_path),
+        ]
+        res = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        data = json.loads(res.stdout or "{}")
+    except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
+        return ()
+
+    keyframes: List[Tuple[float, int]] = []
+    for index, packet in enumerate(data.get("packets", [])):
+        if "K" in packet.get("flags", "") and packet.get("pts_time") not in (None, "N/A"):
+            keyframes.append((float(packet["pts_time"]), index))
+    return tuple(sorted(keyframes))
+
+
+@_cached_per_file
+def _stream_signature(video_path: Path) -> Optional[tuple]:
+    """Return the codec parameters that must match for a ``-c copy`` concat.
+
+    Covers the first video stream's codec, profile, and pixel format and the
+    first audio stream's codec, sample rate, and channel layout. Returns None
+    if ffprobe is unavailable or fails, so callers can refuse to stream copy.
+    """
+
+    try:
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "stream=codec_type,codec_name,profile,pix_fmt,sample_rate,channels,channel_layout",
+            "-of",
+            "json",
+            str(video_path),
+        ]
+        res = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        streams = json.loads(res.stdout or "{}").get("streams", [])
+    except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    return (
+        (video.get("codec_name"), video.get("profile"), video.get("pix_fmt")) if video else None,
+        (
+            audio.get("codec_name"),
+            audio.get("sample_rate"),
+            audio.get("channels"),
+            audio.get("channel_layout"),
+        )
+        if audio
+        else None,
+    )
+
+
+def prefetch_stitch_metadata(video_path: Path) -> None:
+    """Warm the probe caches :func:`stitch_videos` consults for ``video_path``.
+
+    Meant to run in the background while the clip that will be stitched after
+    ``video_path`` is still being generated, so the stitch itself starts with
+    duration, audio layout, and keyframes already known. Probe failures are
+    ignored; stitching simply probes again.
+
+    Args:
+        video_path: Clip that will be stitched once its successor is ready.
+
+    Examples:
+        >>> threading.Thread(target=prefetch_stitch_metadata, args=(Path("a.mp4"),)).start()
+    """
+    try:
+        get_video_info(video_path)
+        _has_audio(video_path)
+        _stream_signature(video_path)
+        _keyframes(video_path)
+    except Exception:
+        pass
+
+
+def _stream_copy_stitch(
+    video_paths: List[Path],
+    clip_info: List[dict],
+    audio_presence: List[bool],
+    overlap: float,
+    output_path: Path,
+) -> bool:
+    """Concatenate clips with ``-c copy`` via the ffmpeg concat demuxer.
+
+    Each clip except the last is first cut with ``-c copy`` just before the
+    keyframe that lands on ``duration - overlap`` (within one frame), so the
+    source is never decoded or re-encoded. Stream-copy ``-to`` (like the concat
+    demuxer's ``outpoint``) compares decode timestamps, which lag display time
+    on clips with B-frames and would keep a few frames past the cut; the video
+    stream is therefore pinned with ``-frames:v`` to the packets decoded before
+    the keyframe, while ``-to`` trims the audio. Returns False without writing
+    output when the clips can't be joined losslessly (mismatched dimensions,
+    frame rate, codec, profile, pixel format, or audio parameters, or no
+    keyframe at the trim point), letting the caller fall back to the
+    re-encoding path.
+    """
+
+    first = clip_info[0]
+    for info in clip_info[1:]:
+        if (info.get("width"), info.get("height")) != (first.get("width"), first.get("height")):
+            return False
+        if abs(float(info.get("fps") or 0.0) - float(first.get("fps") or 0.0)) > 0.01:
+            return False
+    if any(audio_presence) and not all(audio_presence):
+        return False
+    # The concat demuxer copies packets blindly: mixing e.g. h264 with hevc or
+    # yuv420p with yuv444p yields an unplayable file while ffmpeg exits 0.
+    signatures = [_stream_signature(path) for path in video_paths]
+    if signatures[0] is None or any(sig != signatures[0] for sig in signatures[1:]):
+        return False
+
+    # (cut time, frames to keep) per clip; None keeps the whole clip
+    cuts: List[Optional[Tuple[float, int]]] = []
+    for idx, (path, info) in enumerate(zip(video_paths, clip_info)):
+        duration = float(info.get("duration") or 0.0)
+        if overlap > 0 and idx < len(video_paths) - 1 and duration - overlap > 0.01:
+            trim_end = duration - overlap
+            cut, frames = max(
+                (kf for kf in _keyframes(path) if kf[0] <= trim_end + 1e-3),
+                default=(0.0, 0),
+            )
+            # Snapping back to an earlier keyframe would silently drop up to a
+            # whole GOP; only copy when the cut is within a frame of the target.
+            fps = float(info.get("fps") or 0.0)
+            tolerance = (1.0 / fps if fps > 0 else 1.0 / 24) + 1e-3
+            if cut <= 0 or trim_end - cut > tolerance:
+                return False
+            cuts.append((cut, frames))
+        else:
+            cuts.append(None)
+
+    with tempfile.TemporaryDirectory(prefix="veo_stitch_") as tmp:
+        entries: List[str] = []
+        for idx, (path, cut) in enumerate(zip(video_paths, cuts)):
+            source = path.resolve()
+            if cut is not None:
+                trimmed = Path(tmp) / f"clip{idx}{path.suffix or '.mp4'}"
+                subprocess.run(
+                    [
+                        "ffmpeg", "-v", "error",
+                        "-i", str(source),
+                        "-map", "0",
+                        "-c", "copy",
+                        "-to", f"{cut[0]:.6f}",
+                        "-frames:v", str(cut[1]),
+                        "-y", str(trimmed),
+                    ],
+                    check=True,
+                    capture_output=True,
+                )
+                source = trimmed
+            entries.append("file '{}'\n".format(str(source).replace("'", "'\\''")))
+
+        concat_list = Path(tmp) / "concat.txt"
+        concat_list.write_text("".join(entries))
+        cmd = [
+            "ffmpeg", "-v", "error",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_list),
+            "-map", "0",
+            "-c", "copy",
+            "-movflags", "+faststart",
+            "-y", str(output_path),
+        ]
+        subprocess.run(cmd, check=True, capture_output=True)
+
+    return True
+
+
 def stitch_videos(
     video_paths: List[Path],
     overlap: float = 1.0,
     output_path: Optional[Path] = None,
     on_progress: Optional[Callable] = None,
+    reencode: bool = False,
+    allow_reencode: bool = True,
 ) -> VideoResult:
     """Seamlessly stitch multiple videos (with audio) into a single timeline.
 
     Uses FFmpeg to concatenate videos while optionally trimming an overlap from
     the tail of each clip (except the last) to create smoother scene transitions.
-    Both audio and video streams are preserved and re-encoded into a single
-    H.264/AAC MP4.
+    By default clips are cut on keyframes and joined with stream copy, so the
+    source H.264 is never decoded. When that isn't possible (or ``reencode`` is
+    set) both audio and video streams are re-encoded into a single H.264/AAC MP4.
 
     Args:
         video_paths: List of paths to video files to stitch together, in order.
@@ -57,14 +319,20 @@ def stitch_videos(
         output_path: Optional custom output path. If None, auto-generates a path
             using :class:`StorageManager`.
         on_progress: Optional callback function called with progress updates (message, percent).
+        reencode: Force a full re-encode with frame-accurate trimming instead of
+            the keyframe-aligned stream-copy path. Defaults to False.
+        allow_reencode: When False, fail instead of falling back to a re-encode
+            if the clips can't be joined with stream copy. Defaults to True.
 
     Returns:
         VideoResult: Object containing the stitched video path, metadata, and operation details.
 
     Raises:
-        ValueError: If fewer than two videos are provided.
+        ValueError: If fewer than two videos are provided, or if ``reencode``
+            is requested while ``allow_reencode`` is False.
         FileNotFoundError: If any input video file doesn't exist.
-        RuntimeError: If FFmpeg fails to stitch the videos.
+        RuntimeError: If FFmpeg fails to stitch the videos, or stream copy isn't
+            possible and ``allow_reencode`` is False.
 
     Examples:
         Stitch videos with default overlap:
@@ -91,13 +359,18 @@ def stitch_videos(
         ... )
 
     Note:
-        - Videos are resized to match the first video's dimensions
-        - Uses H.264 encoding with CRF 23 for good quality/size balance
-        - Automatically handles frame rate consistency
-        - FFmpeg is used for final encoding if available, otherwise uses OpenCV
+        - Stream copy is only used when a keyframe falls within one frame of
+          ``duration - overlap``; otherwise the clips are re-encoded so the
+          overlap is trimmed exactly
+        - Clips with differing dimensions, frame rates, codecs, pixel formats,
+          or audio parameters are always re-encoded to H.264, on
+          NVENC/VideoToolbox/QSV when ffmpeg offers one (``VEO_HW_ENCODE=0``
+          disables this), else libx264 CRF 21
     """
     if len(video_paths) < 2:
         raise ValueError("Need at least two videos to stitch")
+    if reencode and not allow_reencode:
+        raise ValueError("reencode=True conflicts with allow_reencode=False")
 
     storage = StorageManager()
     progress = ProgressTracker(on_progress)
@@ -130,6 +403,25 @@ def stitch_videos(
             output_path = storage.get_video_path(filename)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if not reencode:
+            progress.update("Concatenating", 50)
+            copy_error: Optional[subprocess.CalledProcessError] = None
+            try:
+                if _stream_copy_stitch(video_paths, clip_info, audio_presence, overlap, output_path):
+                    return _finish_stitch(result, output_path, storage, progress)
+            except subprocess.CalledProcessError as exc:
+                copy_error = exc
+            if not allow_reencode:
+                if copy_error is not None:
+                    raise RuntimeError(
+                        "Failed to stitch videos with ffmpeg stream copy and re-encoding is "
+                        f"disabled: {copy_error.stderr.decode().strip() if copy_error.stderr else copy_error}"
+                    ) from copy_error
+                raise RuntimeError(
+                    "Clips can't be joined with stream copy (mismatched streams or no "
+                    "keyframe before the overlap) and re-encoding is disabled"
+                )
+
         filter_parts: List[str] = []
         video_refs: List[str] = []
         audio_refs: List[str] = []
@@ -190,45 +482,65 @@ def stitch_videos(
         ])
         if include_audio:
             cmd.extend(["-map", "[outa]"])
-        cmd.extend([
-            "-c:v", "libx264",
-            "-preset", "fast",
-            "-crf", "21",
-            "-pix_fmt", "yuv420p",
-        ])
+
+        tail: List[str] = ["-pix_fmt", "yuv420p"]
         if include_audio:
-            cmd.extend(["-c:a", "aac", "-b:a", "192k"])
-        cmd.extend([
+            tail.extend(["-c:a", "aac", "-b:a", "192k"])
+        tail.extend([
             "-movflags", "+faststart",
             "-y",
             str(output_path),
         ])
 
         progress.update("Encoding", 90)
-        try:
-            subprocess.run(cmd, check=True, capture_output=True)
-        except subprocess.CalledProcessError as exc:
-            raise RuntimeError(
-                f"Failed to stitch videos with ffmpeg: {exc.stderr.decode().strip() if exc.stderr else exc}"
-            ) from exc
-
-        progress.complete("Complete")
-
-        result.path = output_path
-        result.url = storage.get_url(output_path)
-        output_info = get_video_info(output_path)
-        result.metadata = VideoMetadata(
-            fps=float(output_info.get("fps") or 0.0),
-            duration=float(output_info.get("duration") or 0.0),
-            width=int(output_info.get("width") or 0),
-            height=int(output_info.get("height") or 0),
-        )
-        result.update_progress("Complete", 100)
+        # A listed hardware encoder can still fail to open (no device, driver
+        # mismatch), so software encoding is always kept as the last attempt.
+        hardware = None
+        hw_enabled = os.getenv("VEO_HW_ENCODE", "1").strip().lower() not in ("0", "false", "no")
+        if hw_enabled and not _hardware_h264_unusable:
+            hardware = _hardware_h264_args()
+        encoders = [args for args in (hardware, _SOFTWARE_H264) if args]
+        for attempt, encoder_args in enumerate(encoders, start=1):
+            try:
+                subprocess.run(cmd + encoder_args + tail, check=True, capture_output=True)
+            except subprocess.CalledProcessError as exc:
+                if attempt < len(encoders):
+                    continue
+                raise RuntimeError(
+                    f"Failed to stitch videos with ffmpeg: {exc.stderr.decode().strip() if exc.stderr else exc}"
+                ) from exc
+            if attempt > 1:
+                # Software worked where hardware didn't: skip the doomed pass from now on
+                _mark_hardware_h264_unusable()
+            break
+
+        return _finish_stitch(result, output_path, storage, progress)
 
     except Exception as exc:
         result.mark_failed(exc)
         raise
 
+
+def _finish_stitch(
+    result: VideoResult,
+    output_path: Path,
+    storage: StorageManager,
+    progress: ProgressTracker,
+) -> VideoResult:
+    """Populate ``result`` with the stitched file's location and metadata."""
+
+    progress.complete("Complete")
+
+    result.path = output_path
+    result.url = storage.get_url(output_path)
+    output_info = get_video_info(output_path)
+    result.metadata = VideoMetadata(
+        fps=float(output_info.get("fps") or 0.0),
+        duration=float(output_info.get("duration") or 0.0),
+        width=int(output_info.get("width") or 0),
+        height=int(output_info.get("height") or 0),
+    )
+    result.update_progress("Complete", 100)
     return result
 
 
@@ -7,6 +7,8 @@ from pathlib import Path
 from unittest.mock import Mock
 import pytest
 
+import veotools.cli  # noqa: F401  (import once per session; test modules hit sys.modules)
+
 
 @pytest.fixture(autouse=True)
 def mock_api_key(monkeypatch):
@@ -14,6 +16,15 @@ def mock_api_key(monkeypatch):
     monkeypatch.setenv("GEMINI_API_KEY", "test-api-key-12345")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _silence_init():
+    """Replace ``veo.init`` with a no-op once for the whole session."""
+    mp = pytest.MonkeyPatch()
+    mp.setattr("veotools.cli.veo.init", lambda: None)
+    yield
+    mp.undo()
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path):
     """Create a temporary output directory for tests."""
@@ -153,6 +153,16 @@ class TestStorageManager:
         assert not temp_file1.exists()
         assert not temp_file2.exists()
         assert manager.temp_dir.exists()  # Directory should still exist
+
+    @pytest.mark.unit
+    def test_cleanup_temp_missing_directory(self, temp_output_dir):
+        """Test cleanup_temp is a no-op when the temp directory was removed."""
+        manager = StorageManager(base_path=str(temp_output_dir))
+        manager.temp_dir.rmdir()
+
+        manager.cleanup_temp()
+
+        assert not manager.temp_dir.exists()
     
     @pytest.mark.unit
     def test_get_url_with_existing_file(self, temp_output_dir):
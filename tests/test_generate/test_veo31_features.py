@@ -2,10 +2,10 @@
 
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import Mock
 
 import pytest
 
+from veotools.generate import video as video_mod
 from veotools.generate.video import (
     extend_video,
     generate_with_interpolation,
@@ -21,16 +21,17 @@ def _fake_client(video_bytes: bytes = b"video"):
     )
     operation = SimpleNamespace(done=False, name="op-1", response=None, error=None)
     return SimpleNamespace(
-        models=SimpleNamespace(generate_videos=Mock(return_value=operation)),
-        operations=SimpleNamespace(get=Mock(return_value=done_operation)),
+        models=SimpleNamespace(generate_videos=lambda *a, **k: operation),
+        operations=SimpleNamespace(get=lambda *a, **k: done_operation),
     )
 
 
 def _setup_generation_mocks(monkeypatch, tmp_path):
     monkeypatch.setenv("VEO_OUTPUT_DIR", str(tmp_path))
-    monkeypatch.setattr("veotools.generate.video.time.sleep", lambda _: None)
+    monkeypatch.setattr(video_mod.time, "sleep", lambda _: None)
     monkeypatch.setattr(
-        "veotools.generate.video.get_video_info",
+        video_mod,
+        "get_video_info",
         lambda _: {"fps": 24, "duration": 8, "width": 1280, "height": 720},
     )
 
@@ -39,7 +40,8 @@ def test_generate_with_reference_images_defaults_person_generation(monkeypatch,
     _setup_generation_mocks(monkeypatch, tmp_path)
     fake_client = _fake_client()
     monkeypatch.setattr(
-        "veotools.generate.video.VeoClient",
+        video_mod,
+        "VeoClient",
         lambda: SimpleNamespace(provider="google", client=fake_client),
     )
 
@@ -51,11 +53,13 @@ def test_generate_with_reference_images_defaults_person_generation(monkeypatch,
         return "CONFIG"
 
     monkeypatch.setattr(
-        "veotools.generate.video.ModelConfig.build_generation_config",
+        video_mod.ModelConfig,
+        "build_generation_config",
         fake_build,
     )
     monkeypatch.setattr(
-        "veotools.generate.video.types.Image.from_file",
+        video_mod.types.Image,
+        "from_file",
         lambda location: SimpleNamespace(source=location),
     )
 
@@ -80,7 +84,8 @@ def test_generate_with_interpolation_includes_last_frame(monkeypatch, tmp_path):
     _setup_generation_mocks(monkeypatch, tmp_path)
     fake_client = _fake_client()
     monkeypatch.setattr(
-        "veotools.generate.video.VeoClient",
+        video_mod,
+        "VeoClient",
         lambda: SimpleNamespace(provider="google", client=fake_client),
     )
 
@@ -91,11 +96,13 @@ def test_generate_with_interpolation_includes_last_frame(monkeypatch, tmp_path):
         return "CONFIG"
 
     monkeypatch.setattr(
-        "veotools.generate.video.ModelConfig.build_generation_config",
+        video_mod.ModelConfig,
+        "build_generation_config",
         fake_build,
     )
     monkeypatch.setattr(
-        "veotools.generate.video.types.Image.from_file",
+        video_mod.types.Image,
+        "from_file",
         lambda location: SimpleNamespace(source=location),
     )
 
@@ -120,11 +127,13 @@ def test_extend_video_defaults_person_generation_allow_all(monkeypatch, tmp_path
     _setup_generation_mocks(monkeypatch, tmp_path)
     fake_client = _fake_client()
     monkeypatch.setattr(
-        "veotools.generate.video.VeoClient",
+        video_mod,
+        "VeoClient",
         lambda: SimpleNamespace(provider="google", client=fake_client),
     )
     monkeypatch.setattr(
-        "veotools.generate.video.types.Video.from_file",
+        video_mod.types.Video,
+        "from_file",
         lambda location: SimpleNamespace(source=location),
     )
 
@@ -135,7 +144,8 @@ def test_extend_video_defaults_person_generation_allow_all(monkeypatch, tmp_path
         return "CONFIG"
 
     monkeypatch.setattr(
-        "veotools.generate.video.ModelConfig.build_generation_config",
+        video_mod.ModelConfig,
+        "build_generation_config",
         fake_build,
     )
 
@@ -150,3 +160,55 @@ def test_extend_video_defaults_person_generation_allow_all(monkeypatch, tmp_path
 
     assert captured["kwargs"]["person_generation"] == "allow_all"
     assert result.path and Path(result.path).exists()
+
+
+def test_download_video_rejects_unrecognised_uri(tmp_path):
+    video = SimpleNamespace(uri="https://example.com/clip.mp4", data=None)
+
+    with pytest.raises(RuntimeError):
+        video_mod._download_video(video, tmp_path / "out.mp4", client=None)
+
+
+def test_download_video_interrupted_leaves_no_file(monkeypatch, tmp_path):
+    class _Response:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            yield b"partial"
+            raise ConnectionError("connection reset")
+
+    session = SimpleNamespace(get=lambda *a, **k: _Response())
+    monkeypatch.setattr(video_mod, "_http_session", lambda: session)
+    video = SimpleNamespace(uri="https://example.com/v1beta/files/abc:download", data=None)
+
+    with pytest.raises(ConnectionError):
+        video_mod._download_video(video, tmp_path / "out.mp4", client=None)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_wait_for_operation_backs_off(monkeypatch):
+    sleeps = []
+    polls = iter([SimpleNamespace(done=False)] * 5 + [SimpleNamespace(done=True, name="op")])
+    client = SimpleNamespace(operations=SimpleNamespace(get=lambda operation: next(polls)))
+    monkeypatch.setattr(video_mod.time, "sleep", sleeps.append)
+    monkeypatch.setattr(video_mod.random, "uniform", lambda a, b: 0.0)
+
+    operation = video_mod._wait_for_operation(
+        client,
+        SimpleNamespace(done=False),
+        video_mod.ProgressTracker(None),
+        estimated_time=60,
+        label="Generating",
+        model="veo-3.0-fast-generate-001",
+    )
+
+    assert operation.done
+    assert sleeps == [3.0, 4.5, 6.75, 10.125, 15.1875, 20.0]
@@ -6,26 +6,92 @@ import json
 from argparse import Namespace
 from pathlib import Path
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 import pytest
 
 from veotools import cli
-from veotools.plan.scene_writer import (
-    ScenePlan,
-    Clip,
-    Shot,
-    Subject,
-    Scene,
-    VisualDetails,
-    Cinematography,
-    AudioTrack,
-    Dialogue,
-    Performance,
-    CharacterProfile,
+
+if TYPE_CHECKING:
+    from veotools.plan.scene_writer import ScenePlan
+
+
+_CLIP_RESULT = SimpleNamespace(path=Path("/tmp/clip.mp4"), to_dict=lambda: {"path": "/tmp/clip.mp4"})
+_EXEC_RESULT_STITCHED = SimpleNamespace(
+    clip_results=[_CLIP_RESULT],
+    final_result=SimpleNamespace(path=Path("/tmp/final.mp4"), to_dict=lambda: {"path": "/tmp/final.mp4"}),
+    to_dict=lambda: {
+        "clips": [{"prompt": "", "result": {"path": "/tmp/clip.mp4"}}],
+        "final_result": {"path": "/tmp/final.mp4"},
+    },
+)
+_EXEC_RESULT_UNSTITCHED = SimpleNamespace(
+    clip_results=[_CLIP_RESULT],
+    final_result=None,
+    to_dict=lambda: {"clips": [{"prompt": "", "result": {"path": "/tmp/clip.mp4"}}], "final_result": None},
+)
+
+_PLAN_NS_DEFAULTS = dict(
+    idea="Idea",
+    scenes=1,
+    character_description=None,
+    character_traits=None,
+    context=None,
+    reference=None,
+    video_type="video",
+    video_characteristics="realistic",
+    camera_angle="front",
+    model=None,
+    save=None,
+    cache=False,
+    json=True,
 )
+_RUN_NS_DEFAULTS = dict(
+    idea="Idea",
+    scenes=1,
+    character_description=None,
+    character_traits=None,
+    context=None,
+    reference=None,
+    video_type=None,
+    video_characteristics=None,
+    camera_angle=None,
+    plan_model=None,
+    save_plan=None,
+    cache_plan=False,
+    execute_model=None,
+    overlap=1.0,
+    no_stitch=False,
+    seed_last_frame=False,
+    seed_offset=-0.5,
+    parallel=1,
+    json=False,
+)
+
+
+def _plan_ns(**kw) -> Namespace:
+    return Namespace(**(_PLAN_NS_DEFAULTS | kw))
+
+
+def _run_ns(**kw) -> Namespace:
+    return Namespace(**(_RUN_NS_DEFAULTS | kw))
 
 
 def _make_plan() -> ScenePlan:
+    from veotools.plan.scene_writer import (
+        ScenePlan,
+        Clip,
+        Shot,
+        Subject,
+        Scene,
+        VisualDetails,
+        Cinematography,
+        AudioTrack,
+        Dialogue,
+        Performance,
+        CharacterProfile,
+    )
+
     character = CharacterProfile(
         name="Nyx Cipher",
         age=27,
@@ -97,28 +163,22 @@ def test_cmd_plan_json_output(monkeypatch, capsys):
         called.update(kwargs)
         return _make_plan()
 
-    monkeypatch.setattr(cli.veo, "init", lambda: None)
     monkeypatch.setattr(cli.veo, "generate_scene_plan", fake_generate_scene_plan)
 
-    ns = Namespace(
+    ns = _plan_ns(
         idea="Luxury energy drink vlog",
         scenes=2,
         character_description="Nyx Cipher — neon rooftop influencer",
         character_traits="playful, confident",
         context="Keep it upbeat",
-        reference=None,
         video_type="vlog",
         video_characteristics="bright, high-definition, comedic",
-        camera_angle="front",
-        model=None,
-        save=None,
-        json=True,
     )
 
     cli.cmd_plan(ns)
 
-    out = capsys.readouterr().out
-    assert "clip-1" in out
+    data = json.loads(capsys.readouterr().out)
+    assert data["clips"][0]["id"] == "clip-1"
     assert called["number_of_scenes"] == 2
     assert called["character_description"].startswith("Nyx Cipher")
     assert called["video_type"] == "vlog"
@@ -131,7 +191,6 @@ def test_cmd_plan_loads_reference(monkeypatch, capsys, tmp_path):
         called.update(kwargs)
         return _make_plan()
 
-    monkeypatch.setattr(cli.veo, "init", lambda: None)
     monkeypatch.setattr(cli.veo, "generate_scene_plan", fake_generate_scene_plan)
 
     ref_path = tmp_path / "ref.json"
@@ -150,16 +209,10 @@ def test_cmd_plan_loads_reference(monkeypatch, capsys, tmp_path):
     }]
     ref_path.write_text(json.dumps(ref_payload), encoding="utf-8")
 
-    ns = Namespace(
+    ns = _plan_ns(
         idea="Luxury energy drink vlog",
-        scenes=1,
-        character_description=None,
-        character_traits=None,
-        context=None,
         reference=[str(ref_path)],
-        video_type="video",
         video_characteristics="realistic, 4k, cinematic",
-        camera_angle="front",
         model="gemini-pro",
         save=tmp_path / "plan.json",
         json=False,
@@ -167,104 +220,78 @@ def test_cmd_plan_loads_reference(monkeypatch, capsys, tmp_path):
 
     cli.cmd_plan(ns)
 
-    out = capsys.readouterr().out
-    assert "Generated plan" in out
+    out = capsys.readouterr().out.encode()
+    assert b"Generated plan" in out
     assert called["character_references"] and called["character_references"][0]["name"] == "Nyx Cipher"
     assert called["model"] == "gemini-pro"
     assert called["save_path"] == ns.save
 
 
 def test_cmd_plan_missing_reference(monkeypatch, tmp_path):
-    monkeypatch.setattr(cli.veo, "init", lambda: None)
     monkeypatch.setattr(cli.veo, "generate_scene_plan", lambda *a, **k: _make_plan())
 
-    ns = Namespace(
-        idea="Idea",
-        scenes=1,
-        character_description=None,
-        character_traits=None,
-        context=None,
-        reference=[str(tmp_path / "missing.json")],
-        video_type="video",
-        video_characteristics="realistic",
-        camera_angle="front",
-        model=None,
-        save=None,
-        json=True,
-    )
+    ns = _plan_ns(reference=[str(tmp_path / "missing.json")])
 
     with pytest.raises(FileNotFoundError):
         cli.cmd_plan(ns)
 
 
-def test_cmd_plan_execute_runs_executor(monkeypatch, capsys):
+@pytest.mark.parametrize(
+    "json_out,no_stitch,seed,model,expected_model",
+    [
+        (False, False, True, None, "veo-3.0-generate-001"),
+        (True, True, False, None, "veo-3.0-generate-001"),
+        (True, True, False, "veo-3.1-generate-preview", "veo-3.1-generate-preview"),
+    ],
+)
+def test_cmd_plan_execute(monkeypatch, capsys, json_out, no_stitch, seed, model, expected_model):
     called = {}
 
     def fake_execute_scene_plan(plan, **kwargs):
         called["plan"] = plan
         called.update(kwargs)
+        return _EXEC_RESULT_UNSTITCHED if no_stitch else _EXEC_RESULT_STITCHED
 
-        clip_result = SimpleNamespace(path=Path("/tmp/clip.mp4"), to_dict=lambda: {"path": "/tmp/clip.mp4"})
-        return SimpleNamespace(
-            clip_results=[clip_result],
-            final_result=SimpleNamespace(path=Path("/tmp/final.mp4"), to_dict=lambda: {"path": "/tmp/final.mp4"}),
-            to_dict=lambda: {
-                "clips": [{"prompt": "", "result": {"path": "/tmp/clip.mp4"}}],
-                "final_result": {"path": "/tmp/final.mp4"},
-            },
-        )
-
-    monkeypatch.setattr(cli.veo, "init", lambda: None)
     monkeypatch.setattr(cli.veo, "execute_scene_plan", fake_execute_scene_plan)
 
     ns = Namespace(
         plan="output-plans/x402_plan.json",
-        model=None,
+        model=model,
         overlap=0.75,
-        no_stitch=False,
-        seed_last_frame=True,
+        no_stitch=no_stitch,
+        seed_last_frame=seed,
         seed_offset=-0.25,
-        json=False,
+        parallel=3,
+        json=json_out,
     )
 
     cli.cmd_plan_execute(ns)
-    out = capsys.readouterr().out
-    assert "Rendered 1 clip(s)" in out
+    out = capsys.readouterr().out.encode()
+    if json_out:
+        data = json.loads(out)
+        assert "clips" in data
+    else:
+        assert b"Rendered 1 clip(s)" in out
     assert called["plan"] == "output-plans/x402_plan.json"
-    assert called["model"] == "veo-3.0-generate-001"
+    assert called["model"] == expected_model
     assert called["overlap"] == 0.75
-    assert called["auto_seed_last_frame"] is True
+    assert called["auto_seed_last_frame"] is seed
     assert called["seed_frame_offset"] == -0.25
-    assert called["stitch"] is True
-
-
-def test_cmd_plan_execute_json(monkeypatch, capsys):
-    monkeypatch.setattr(cli.veo, "init", lambda: None)
-
-    result_obj = SimpleNamespace(
-        clip_results=[SimpleNamespace(path=Path("/tmp/clip.mp4"), to_dict=lambda: {"path": "clip"})],
-        final_result=None,
-        to_dict=lambda: {"clips": [{"prompt": "", "result": {"path": "clip"}}], "final_result": None},
-    )
+    assert called["stitch"] is not no_stitch
+    assert called["max_parallel_clips"] == 3
 
-    monkeypatch.setattr(cli.veo, "execute_scene_plan", lambda *a, **k: result_obj)
 
-    ns = Namespace(
-        plan="plan.json",
-        model="veo-3.0-generate-001",
-        overlap=1.0,
-        no_stitch=True,
-        seed_last_frame=False,
-        seed_offset=-0.5,
-        json=True,
-    )
-
-    cli.cmd_plan_execute(ns)
-    out = capsys.readouterr().out
-    assert "\"clips\"" in out
-
-
-def test_cmd_plan_run(monkeypatch, capsys, tmp_path):
+@pytest.mark.parametrize(
+    "json_out,no_stitch,seed,save_plan,plan_model,execute_model",
+    [
+        (False, False, True, "plan.json", "gemini-2.5-pro", "veo-3.0-generate-001"),
+        (False, False, False, None, None, None),
+        (True, True, False, None, None, None),
+    ],
+)
+def test_cmd_plan_run(
+    monkeypatch, capsys, tmp_path, json_out, no_stitch, seed, save_plan, plan_model, execute_model
+):
     plan_called = {}
     exec_called = {}
 
@@ -282,101 +309,44 @@ def test_cmd_plan_run(monkeypatch, capsys, tmp_path):
     def fake_execute_scene_plan(plan, **kwargs):
         exec_called["plan"] = plan
         exec_called["kwargs"] = kwargs
-        clip_result = SimpleNamespace(path=Path("/tmp/clip.mp4"), to_dict=lambda: {"path": "/tmp/clip.mp4"})
-        return SimpleNamespace(
-            clip_results=[clip_result],
-            final_result=SimpleNamespace(path=Path("/tmp/final.mp4"), to_dict=lambda: {"path": "/tmp/final.mp4"}),
-            to_dict=lambda: {
-                "clips": [{"prompt": "", "result": {"path": "/tmp/clip.mp4"}}],
-                "final_result": {"path": "/tmp/final.mp4"},
-            },
-        )
-
-    monkeypatch.setattr(cli.veo, "init", lambda: None)
+        return _EXEC_RESULT_UNSTITCHED if no_stitch else _EXEC_RESULT_STITCHED
+
     monkeypatch.setattr(cli.veo, "generate_scene_plan", fake_generate_scene_plan)
     monkeypatch.setattr(cli.veo, "execute_scene_plan", fake_execute_scene_plan)
 
-    plan_path = tmp_path / "plan.json"
+    plan_path = str(tmp_path / save_plan) if save_plan else None
 
-    ns = Namespace(
-        idea="Idea",
+    ns = _run_ns(
         scenes=3,
-        character_description=None,
-        character_traits=None,
-        context=None,
-        reference=None,
-        video_type=None,
-        video_characteristics=None,
-        camera_angle=None,
-        plan_model="gemini-2.5-pro",
-        save_plan=str(plan_path),
-        execute_model="veo-3.0-generate-001",
+        plan_model=plan_model,
+        save_plan=plan_path,
+        execute_model=execute_model,
         overlap=0.5,
-        no_stitch=False,
-        seed_last_frame=True,
+        no_stitch=no_stitch,
+        seed_last_frame=seed,
         seed_offset=-0.25,
-        json=False,
+        json=json_out,
     )
 
     cli.cmd_plan_run(ns)
-    out = capsys.readouterr().out
-    assert "Generated plan" in out
-    assert "Rendered 1 clip" in out
-    assert "Final video" in out
-    assert "Plan saved" in out
+    out = capsys.readouterr().out.encode()
+    if json_out:
+        data = json.loads(out)
+        assert "plan" in data and "execution" in data
+    else:
+        assert b"Generated plan" in out
+        assert b"Rendered 1 clip" in out
+        assert b"Final video" in out
+        assert (b"Plan saved" in out) is bool(save_plan)
 
     assert plan_called["args"] == ("Idea",)
     assert plan_called["kwargs"]["number_of_scenes"] == 3
-    assert plan_called["kwargs"]["model"] == "gemini-2.5-pro"
-    assert plan_called["kwargs"]["save_path"] == str(plan_path)
+    assert plan_called["kwargs"].get("model") == plan_model
+    assert plan_called["kwargs"].get("save_path") == plan_path
 
     assert exec_called["plan"] is plan_obj
-    assert exec_called["kwargs"]["model"] == "veo-3.0-generate-001"
+    assert exec_called["kwargs"]["model"] == (execute_model or "veo-3.0-generate-001")
     assert exec_called["kwargs"]["overlap"] == 0.5
-    assert exec_called["kwargs"]["auto_seed_last_frame"] is True
+    assert exec_called["kwargs"]["stitch"] is not no_stitch
+    assert exec_called["kwargs"]["auto_seed_last_frame"] is seed
     assert exec_called["kwargs"]["seed_frame_offset"] == -0.25
-
-
-def test_cmd_plan_run_json(monkeypatch, capsys):
-    plan_obj = SimpleNamespace(
-        clips=[SimpleNamespace(id="clip_001")],
-        model_dump_json=lambda: json.dumps({"clips": [{"id": "clip_001"}]})
-    )
-
-    monkeypatch.setattr(cli.veo, "init", lambda: None)
-    monkeypatch.setattr(cli.veo, "generate_scene_plan", lambda *a, **k: plan_obj)
-
-    exec_result = SimpleNamespace(
-        clip_results=[SimpleNamespace(path=Path("/tmp/clip.mp4"), to_dict=lambda: {"path": "clip"})],
-        final_result=None,
-        to_dict=lambda: {"clips": [{"prompt": "", "result": {"path": "clip"}}], "final_result": None},
-    )
-
-    def fake_execute(plan, **kwargs):
-        return exec_result
-
-    monkeypatch.setattr(cli.veo, "execute_scene_plan", fake_execute)
-
-    ns = Namespace(
-        idea="Idea",
-        scenes=1,
-        character_description=None,
-        character_traits=None,
-        context=None,
-        reference=None,
-        video_type=None,
-        video_characteristics=None,
-        camera_angle=None,
-        plan_model=None,
-        save_plan=None,
-        execute_model=None,
-        overlap=1.0,
-        no_stitch=False,
-        seed_last_frame=False,
-        seed_offset=-0.5,
-        json=True,
-    )
-
-    cli.cmd_plan_run(ns)
-    out = capsys.readouterr().out
-    assert "\"plan\"" in out and "\"execution\"" in out
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
 from veotools.models import VideoResult
+from veotools.plan import executor as executor_mod
 from veotools.plan.executor import execute_scene_plan, PlanExecutionResult
 
 
@@ -153,14 +155,18 @@ def test_execute_scene_plan_generates_and_stitches(monkeypatch, tmp_path):
         return result
 
     monkeypatch.setattr(
-        "veotools.plan.executor.generate_from_text", fake_generate_from_text
+        executor_mod,
+        "generate_from_text",
+        fake_generate_from_text,
     )
     monkeypatch.setattr(
-        "veotools.plan.executor.generate_from_image",
+        executor_mod,
+        "generate_from_image",
         lambda *a, **k: pytest.fail("generate_from_image should not be used"),
     )
     monkeypatch.setattr(
-        "veotools.plan.executor.stitch_videos",
+        executor_mod,
+        "stitch_videos",
         fake_stitch,
     )
 
@@ -185,15 +191,18 @@ def test_execute_scene_plan_with_image_provider(monkeypatch, tmp_path):
         return res
 
     monkeypatch.setattr(
-        "veotools.plan.executor.generate_from_image",
+        executor_mod,
+        "generate_from_image",
         fake_generate_from_image,
     )
     monkeypatch.setattr(
-        "veotools.plan.executor.generate_from_text",
+        executor_mod,
+        "generate_from_text",
         lambda *a, **k: pytest.fail("Expected image-based generation"),
     )
     monkeypatch.setattr(
-        "veotools.plan.executor.stitch_videos",
+        executor_mod,
+        "stitch_videos",
         lambda video_paths, overlap=1.0, on_progress=None: VideoResult(),
     )
 
@@ -240,19 +249,23 @@ def test_execute_scene_plan_auto_seed_last_frame(monkeypatch, tmp_path):
         return result
 
     monkeypatch.setattr(
-        "veotools.plan.executor.generate_from_text",
+        executor_mod,
+        "generate_from_text",
         fake_generate_from_text,
     )
     monkeypatch.setattr(
-        "veotools.plan.executor.generate_from_image",
+        executor_mod,
+        "generate_from_image",
         fake_generate_from_image,
     )
     monkeypatch.setattr(
-        "veotools.plan.executor.extract_frame",
+        executor_mod,
+        "extract_frame",
         fake_extract_frame,
     )
     monkeypatch.setattr(
-        "veotools.plan.executor.stitch_videos",
+        executor_mod,
+        "stitch_videos",
         lambda video_paths, overlap=1.0, on_progress=None: VideoResult(),
     )
 
@@ -266,3 +279,130 @@ def test_execute_scene_plan_auto_seed_last_frame(monkeypatch, tmp_path):
     assert image_calls == [seed_path]
     assert extract_calls == [(tmp_path / "clip_1.mp4", -0.25)]
     assert len(result.clip_results) == 2
+
+
+def test_execute_scene_plan_calls_image_provider_lazily(monkeypatch, tmp_path):
+    plan = _make_plan_dict()
+    events: list[str] = []
+
+    def fake_generate_from_text(prompt, *, model, on_progress=None, **kwargs):
+        events.append(f"render {prompt.splitlines()[0].split()[-1]}")
+        result = VideoResult()
+        result.path = tmp_path / "clip.mp4"
+        return result
+
+    def image_provider(clip, idx, plan):
+        events.append(f"provide {clip.id}")
+        return None
+
+    monkeypatch.setattr(executor_mod, "generate_from_text", fake_generate_from_text)
+    monkeypatch.setattr(executor_mod, "extract_frame", lambda *a, **k: None)
+
+    execute_scene_plan(
+        plan,
+        image_provider=image_provider,
+        auto_seed_last_frame=True,
+        stitch=False,
+    )
+
+    # Each provider runs just before it's needed; the look-ahead for the second
+    # clip's seed frame is reused rather than asked again
+    assert events == [
+        "provide clip_001",
+        "render clip_001",
+        "provide clip_002",
+        "render clip_002",
+    ]
+
+
+def test_execute_scene_plan_renders_independent_clips_concurrently(monkeypatch, tmp_path):
+    plan = _make_plan_dict()
+    # Both renders must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_generate_from_text(prompt, *, model, on_progress=None, **kwargs):
+        barrier.wait()
+        result = VideoResult()
+        result.path = tmp_path / f"{prompt.splitlines()[0].split()[-1]}.mp4"
+        return result
+
+    monkeypatch.setattr(
+        executor_mod,
+        "generate_from_text",
+        fake_generate_from_text,
+    )
+
+    result = execute_scene_plan(plan, stitch=False, max_parallel_clips=2)
+
+    assert [r.path.name for r in result.clip_results] == ["clip_001.mp4", "clip_002.mp4"]
+
+
+def test_execute_scene_plan_parallel_failure_cancels_pending_clips(monkeypatch, tmp_path):
+    plan = _make_plan_dict()
+    plan["clips"].append(dict(plan["clips"][-1], id="clip_003"))
+    rendered: list[str] = []
+    in_flight = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def fake_generate_from_text(prompt, *, model, on_progress=None, **kwargs):
+        clip_id = prompt.splitlines()[0].split()[-1]
+        rendered.append(clip_id)
+        if clip_id == "clip_001":
+            # Fail only once the second clip is rendering
+            in_flight.wait(timeout=5)
+            raise RuntimeError("quota exceeded")
+        in_flight.set()
+        try:
+            release.wait(timeout=5)
+        finally:
+            finished.set()
+        result = VideoResult()
+        result.path = tmp_path / f"{clip_id}.mp4"
+        return result
+
+    monkeypatch.setattr(executor_mod, "generate_from_text", fake_generate_from_text)
+
+    with pytest.raises(RuntimeError, match="quota exceeded"):
+        execute_scene_plan(plan, stitch=False, max_parallel_clips=2)
+
+    # The failure surfaced while the second clip was still in flight
+    assert not finished.is_set()
+    release.set()
+    assert finished.wait(timeout=5)
+    # Its worker is free again, but the queued third clip was never started
+    assert sorted(rendered) == ["clip_001", "clip_002"]
+
+
+def test_execute_scene_plan_auto_seed_skips_provided_images(monkeypatch, tmp_path):
+    plan = _make_plan_dict()
+    rendered: list[str] = []
+
+    def fake_generate_from_image(image_path, prompt, *, model, on_progress=None, **kwargs):
+        rendered.append(threading.current_thread().name)
+        res = VideoResult()
+        res.path = tmp_path / f"clip_{len(rendered)}.mp4"
+        return res
+
+    monkeypatch.setattr(
+        executor_mod,
+        "generate_from_image",
+        fake_generate_from_image,
+    )
+    monkeypatch.setattr(
+        executor_mod,
+        "extract_frame",
+        lambda *a, **k: pytest.fail("Provided seed images make frame extraction unnecessary"),
+    )
+
+    result = execute_scene_plan(
+        plan,
+        image_provider=lambda clip, idx, plan: tmp_path / "seed.png",
+        auto_seed_last_frame=True,
+        stitch=False,
+        max_parallel_clips=2,
+    )
+
+    assert len(result.clip_results) == 2
+    # No clip depends on another, so rendering moves onto the worker pool
+    assert all(name != threading.main_thread().name for name in rendered)
@@ -7,9 +7,12 @@ from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
+from google.genai import types
 
+from veotools.plan import scene_writer
 from veotools.plan.scene_writer import (
     CharacterProfile,
+    Clip,
     ScenePlan,
     SceneWriter,
     generate_scene_plan,
@@ -86,8 +89,16 @@ def _sample_plan_payload() -> dict:
     }
 
 
+@pytest.fixture(autouse=True)
+def _clear_plan_cache():
+    scene_writer._PLAN_CACHE.clear()
+    yield
+    scene_writer._PLAN_CACHE.clear()
+
+
 def _patch_client(monkeypatch, capture):
     def fake_generate_content(*, model, contents, config):
+        capture["calls"] = capture.get("calls", 0) + 1
         capture["model"] = model
         capture["contents"] = contents
         capture["config"] = config
@@ -157,6 +168,39 @@ def test_scene_writer_includes_character_context(monkeypatch):
     assert "Keep it upbeat" in prompt
 
 
+@pytest.mark.parametrize(
+    "writer_kwargs,context,expected_calls",
+    [
+        ({"cache": True}, None, 1),
+        ({"cache": True}, "A seeded grass field", 1),
+        ({}, None, 2),
+    ],
+)
+def test_scene_writer_caches_identical_requests(
+    monkeypatch, writer_kwargs, context, expected_calls
+):
+    capture: dict = {}
+    _patch_client(monkeypatch, capture)
+
+    writer = SceneWriter(**writer_kwargs)
+    first = writer.generate("Poolside brag vlog", number_of_scenes=1, additional_context=context)
+    second = writer.generate("Poolside brag vlog", number_of_scenes=1, additional_context=context)
+
+    assert capture["calls"] == expected_calls
+    assert first == second
+
+
+@pytest.mark.parametrize("cache,expected_calls", [(False, 2), (True, 1)])
+def test_generate_scene_plan_cache_is_opt_in(monkeypatch, cache, expected_calls):
+    capture: dict = {}
+    _patch_client(monkeypatch, capture)
+
+    for _ in range(2):
+        generate_scene_plan("Poolside brag vlog", number_of_scenes=1, cache=cache)
+
+    assert capture["calls"] == expected_calls
+
+
 @pytest.mark.parametrize("empty_response", [None, ""])
 def test_scene_writer_raises_on_empty_response(monkeypatch, empty_response):
     def fake_generate_content(*, model, contents, config):
@@ -195,3 +239,100 @@ def test_scene_writer_daydreams_strips_code_fence(monkeypatch):
 
     assert plan.characters == []
     assert plan.clips == []
+
+
+def test_scene_writer_unfences_custom_config_response(monkeypatch):
+    fenced = "```json\n" + json.dumps(_sample_plan_payload()) + "\n```"
+
+    def fake_generate_content(*, model, contents, config):
+        return SimpleNamespace(text=fenced)
+
+    fake_client = SimpleNamespace(models=SimpleNamespace(generate_content=fake_generate_content))
+    monkeypatch.setattr(
+        "veotools.plan.scene_writer.VeoClient",
+        lambda: SimpleNamespace(client=fake_client),
+    )
+
+    writer = SceneWriter()
+    plan = writer.generate(
+        "Neon skyline",
+        number_of_scenes=1,
+        config=types.GenerateContentConfig(temperature=0.2),
+    )
+
+    assert plan.clips[0].id == "clip-1"
+
+
+def test_scene_plan_accepts_compact_keys():
+    payload = _sample_plan_payload()
+    character = payload["characters"][0]
+    character["dm"] = character.pop("distinguishing_marks")
+    character["msi"] = character.pop("mouth_shape_intensity")
+    clip = payload["clips"][0]
+    clip["perf"] = {"msi": 0.7, "ecr": 0.5}
+    del clip["performance"]
+    clip["dur"] = clip.pop("duration_sec")
+
+    plan = ScenePlan.model_validate(payload)
+
+    assert plan.characters[0].distinguishing_marks == "star tattoo behind right ear"
+    assert plan.clips[0].performance.mouth_shape_intensity == 0.7
+    dumped = json.loads(plan.model_dump_json())
+    assert "duration_sec" in dumped["clips"][0]
+    assert "dur" not in dumped["clips"][0]
+
+
+@pytest.mark.parametrize("env_value,expected_key", [(None, "dur"), ("0", "duration_sec")])
+def test_scene_writer_schema_key_style(monkeypatch, env_value, expected_key):
+    capture: dict = {}
+    _patch_client(monkeypatch, capture)
+    if env_value is None:
+        monkeypatch.delenv("VEO_COMPACT_PLAN", raising=False)
+    else:
+        monkeypatch.setenv("VEO_COMPACT_PLAN", env_value)
+
+    SceneWriter().generate("Neon skyline", number_of_scenes=1)
+
+    clip_schema = capture["config"].response_json_schema["$defs"]["Clip"]
+    assert expected_key in clip_schema["properties"]
+
+
+def test_scene_writer_stream_yields_items_before_response_ends(monkeypatch):
+    text = json.dumps(_sample_plan_payload())
+    chunks = [text[i:i + 40] for i in range(0, len(text), 40)]
+    sent: list = []
+
+    def fake_generate_content_stream(*, model, contents, config):
+        for chunk in chunks:
+            sent.append(chunk)
+            yield SimpleNamespace(text=chunk)
+
+    fake_models = SimpleNamespace(generate_content_stream=fake_generate_content_stream)
+    monkeypatch.setattr(
+        "veotools.plan.scene_writer.VeoClient",
+        lambda: SimpleNamespace(client=SimpleNamespace(models=fake_models)),
+    )
+
+    seen = []
+    for item in SceneWriter(cache=True).stream("Neon skyline", number_of_scenes=1):
+        seen.append((type(item), len(sent)))
+
+    assert [kind for kind, _ in seen] == [CharacterProfile, Clip]
+    assert seen[0][1] < len(chunks)
+    assert len(scene_writer._PLAN_CACHE) == 1
+
+
+def test_scene_writer_daydreams_coerces_video_prompts(monkeypatch):
+    content = json.dumps(
+        {"video_prompts": [{"scene_prompt": "A neon skyline at dusk", "duration_seconds": 6}]}
+    )
+    client = Mock()
+    client.create_chat_completion.return_value = {"choices": [{"message": {"content": content}}]}
+    wrapper = SimpleNamespace(provider="daydreams", client=client)
+    monkeypatch.setattr("veotools.plan.scene_writer.VeoClient", lambda: wrapper)
+
+    plan = SceneWriter().generate("Neon skyline", number_of_scenes=1)
+
+    assert plan.characters == []
+    assert plan.clips[0].subject.description == "A neon skyline at dusk"
+    assert plan.clips[0].duration_sec == 6
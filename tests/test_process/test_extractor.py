@@ -0,0 +1,94 @@
+"""Tests for frame extraction helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from veotools.process import extractor
+from veotools.process.extractor import extract_frame, extract_frames, get_video_info
+
+
+def _write_ramp_video(path: Path, frames: int = 48, fps: int = 24) -> Path:
+    """Write a tiny clip whose frame brightness increases with the frame index."""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (64, 48))
+    for idx in range(frames):
+        writer.write(np.full((48, 64, 3), idx * 5, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+@pytest.fixture
+def ramp_video(tmp_path):
+    return _write_ramp_video(tmp_path / "ramp.mp4")
+
+
+def _brightness(path: Path) -> float:
+    return float(cv2.imread(str(path)).mean())
+
+
+def test_extract_frames_preserves_input_order(ramp_video, tmp_path):
+    out_dir = tmp_path / "frames"
+    out_dir.mkdir()
+
+    frames = extract_frames(ramp_video, [1.5, 0.25, -0.5, 0.25], output_dir=out_dir)
+
+    assert [p.name.split("_")[1] for p in frames] == ["000", "001", "002", "003"]
+    levels = [_brightness(p) for p in frames]
+    # 1.5s and -0.5s resolve to the same frame; 0.25s is much earlier
+    assert levels[1] < levels[0]
+    assert levels[1] == pytest.approx(levels[3], abs=1)
+    assert levels[0] == pytest.approx(levels[2], abs=3)
+
+
+def test_extract_frames_matches_single_frame_extraction(ramp_video, tmp_path):
+    out_dir = tmp_path / "frames"
+    out_dir.mkdir()
+
+    (batched,) = extract_frames(ramp_video, [1.0], output_dir=out_dir)
+    single = extract_frame(ramp_video, 1.0, output_path=tmp_path / "single.jpg")
+
+    assert _brightness(batched) == pytest.approx(_brightness(single), abs=3)
+
+
+def test_extract_frames_missing_video(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        extract_frames(tmp_path / "missing.mp4", [0.0])
+
+
+def test_get_video_info_cached_until_file_changes(ramp_video, monkeypatch):
+    first = get_video_info(ramp_video)
+    first["fps"] = -1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("metadata should come from the cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(extractor.subprocess, "run", fail)
+        m.setattr(extractor, "_open_capture", fail)
+        cached = get_video_info(ramp_video)
+    assert cached["frame_count"] == 48
+    assert cached["fps"] == pytest.approx(24.0)
+
+    _write_ramp_video(ramp_video, frames=24)
+    assert get_video_info(ramp_video)["frame_count"] == 24
+
+
+@pytest.mark.parametrize("suffix,magic", [(".jpg", b"\xff\xd8"), (".png", b"\x89PNG")])
+def test_extract_frame_format_follows_suffix(ramp_video, tmp_path, suffix, magic):
+    out = extract_frame(ramp_video, 0.5, output_path=tmp_path / f"frame{suffix}")
+
+    assert out.read_bytes().startswith(magic)
+
+
+def test_get_video_info_batch_keeps_order_and_tolerates_missing(ramp_video, tmp_path):
+    other = _write_ramp_video(tmp_path / "short.mp4", frames=24)
+
+    infos = extractor.get_video_info_batch([other, tmp_path / "missing.mp4", ramp_video, other])
+
+    assert [info.get("frame_count") for info in infos] == [24, None, 48, 24]
+    infos[0]["fps"] = -1
+    assert infos[3]["fps"] == pytest.approx(24.0)
@@ -0,0 +1,308 @@
+"""Tests for the MCP server job streaming helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("mcp.server.fastmcp")
+
+from veotools.api import mcp_api  # noqa: E402
+from veotools.server import mcp_server  # noqa: E402
+
+
+class _FakeContext:
+    def __init__(self):
+        self.reports: list[tuple[float, str]] = []
+
+    async def report_progress(self, progress, total=None, message=None):
+        self.reports.append((progress, message))
+
+
+def _fake_statuses(monkeypatch, statuses):
+    calls = []
+    it = iter(statuses)
+
+    def fake_generate_get(job_id):
+        calls.append(job_id)
+        return next(it)
+
+    monkeypatch.setattr(mcp_server.veo, "generate_get", fake_generate_get)
+    return calls
+
+
+def test_stream_job_reports_only_changed_progress(monkeypatch):
+    running = {"status": "processing", "progress": 40, "message": "Generating"}
+    calls = _fake_statuses(
+        monkeypatch,
+        [running, running, running, {"status": "complete", "progress": 100, "result": {}}],
+    )
+    monkeypatch.setattr(mcp_server, "_POLL_INITIAL_SECONDS", 0.001)
+    monkeypatch.setattr(mcp_server, "_POLL_MAX_SECONDS", 0.004)
+    ctx = _FakeContext()
+
+    status = asyncio.run(mcp_server._stream_job("job-1", ctx, time.monotonic() + 60))
+
+    assert status["status"] == "complete"
+    assert len(calls) == 4
+    assert [p for p, _ in ctx.reports] == [0.4, 1.0]
+
+
+def test_stream_job_wakes_on_job_update(monkeypatch):
+    _fake_statuses(
+        monkeypatch,
+        [{"status": "processing", "progress": 5}, {"status": "complete", "progress": 100}],
+    )
+    # Without a notification the first wait would last the full 30s
+    monkeypatch.setattr(mcp_server, "_POLL_INITIAL_SECONDS", 30.0)
+
+    async def scenario():
+        waiter = asyncio.create_task(
+            mcp_server._stream_job("job-1", _FakeContext(), time.monotonic() + 60)
+        )
+        await asyncio.sleep(0.05)
+        threading.Thread(target=mcp_api._notify_job_update, args=("job-1",)).start()
+        return await asyncio.wait_for(waiter, timeout=5)
+
+    started = time.monotonic()
+    status = asyncio.run(scenario())
+
+    assert status["status"] == "complete"
+    assert time.monotonic() - started < 5
+    assert mcp_api._job_listeners == []
+
+
+def test_stream_job_shares_one_poller_per_job(monkeypatch):
+    calls = _fake_statuses(
+        monkeypatch,
+        [{"status": "processing", "progress": 5}, {"status": "complete", "progress": 100}],
+    )
+    monkeypatch.setattr(mcp_server, "_POLL_INITIAL_SECONDS", 30.0)
+
+    async def scenario():
+        waiters = [
+            asyncio.create_task(
+                mcp_server._stream_job("job-1", _FakeContext(), time.monotonic() + 60)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        mcp_api._notify_job_update("job-1")
+        return await asyncio.wait_for(asyncio.gather(*waiters), timeout=5)
+
+    statuses = asyncio.run(scenario())
+
+    assert [s["status"] for s in statuses] == ["complete"] * 3
+    assert len(calls) == 2
+    assert mcp_server._job_pollers == {}
+    assert mcp_server._streaming_clients == 0
+
+
+def test_generate_get_returns_snapshot_after_deadline(monkeypatch):
+    running = {"status": "processing", "progress": 10}
+    _fake_statuses(monkeypatch, [running] * 50)
+
+    status = asyncio.run(mcp_server.generate_get("job-1", _FakeContext(), wait_ms=1))
+
+    assert status == running
+
+
+def test_list_recent_videos_newest_first(tmp_path, monkeypatch):
+    monkeypatch.setenv("VEO_OUTPUT_DIR", str(tmp_path))
+    videos = mcp_server.veo.StorageManager().videos_dir
+    for idx, name in enumerate(["old.mp4", "new.mp4", "mid.mp4", ".hidden.mp4"]):
+        path = videos / name
+        path.write_bytes(b"")
+        os.utime(path, ns=(idx, [1, 4, 3, 2][idx] * 1_000_000_000))
+    (videos / "notes.txt").write_text("skip me")
+    monkeypatch.setattr(
+        mcp_server, "get_video_info_batch", lambda paths, workers: [{"name": p.name} for p in paths]
+    )
+
+    listing = asyncio.run(mcp_server.list_recent_videos(limit=3))
+
+    # Dotfiles are listed too, as Path.glob("*.mp4") did
+    assert [item["metadata"]["name"] for item in listing] == ["new.mp4", "mid.mp4", ".hidden.mp4"]
+    assert listing[0]["modified"] == 4.0
+
+
+def test_continue_video_stitches_off_the_event_loop(tmp_path, monkeypatch):
+    loop_thread = threading.get_ident()
+    threads = {}
+    _fake_statuses(
+        monkeypatch,
+        [{"status": "complete", "progress": 100, "result": {"path": str(tmp_path / "new.mp4")}}],
+    )
+    monkeypatch.setattr(mcp_server.veo, "generate_start", lambda params: {"job_id": "job-1"})
+    monkeypatch.setattr(mcp_server, "prefetch_stitch_metadata", lambda path: None)
+
+    def fake_stitch(paths, overlap, allow_reencode):
+        threads["stitch"] = threading.get_ident()
+        return type("Result", (), {"to_dict": lambda self: {"path": "out.mp4"}})()
+
+    monkeypatch.setattr(mcp_server.veo, "stitch_videos", fake_stitch)
+
+    result = asyncio.run(
+        mcp_server.continue_video(str(tmp_path / "src.mp4"), "next", _FakeContext(), wait_ms=1000)
+    )
+
+    assert result["stage"] == "complete"
+    assert result["stitched"] == {"path": "out.mp4"}
+    assert threads["stitch"] != loop_thread
+
+
+def test_continue_video_cancels_job_when_client_disconnects(tmp_path, monkeypatch):
+    _fake_statuses(monkeypatch, [{"status": "processing", "progress": 5}] * 10)
+    monkeypatch.setattr(mcp_server, "_POLL_INITIAL_SECONDS", 30.0)
+    monkeypatch.setattr(mcp_server.veo, "generate_start", lambda params: {"job_id": "job-1"})
+    monkeypatch.setattr(mcp_server, "prefetch_stitch_metadata", lambda path: None)
+    cancelled = []
+    monkeypatch.setattr(mcp_server.veo, "generate_cancel", cancelled.append)
+
+    async def scenario():
+        task = asyncio.create_task(
+            mcp_server.continue_video(str(tmp_path / "src.mp4"), "next", _FakeContext())
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+    assert cancelled == ["job-1"]
+    assert mcp_server._job_pollers == {}
+
+
+def test_get_job_returns_stored_record_without_params(tmp_path, monkeypatch):
+    monkeypatch.setenv("VEO_OUTPUT_DIR", str(tmp_path))
+    store = mcp_api.JobStore()
+    store.create(
+        mcp_api.JobRecord(
+            job_id="job-1",
+            status="processing",
+            progress=30,
+            message="Generating",
+            created_at=1.0,
+            updated_at=2.0,
+            cancel_requested=False,
+            kind="text",
+            params={"prompt": "secret sauce"},
+        )
+    )
+
+    record = mcp_server.get_job("job-1")
+
+    assert record["status"] == "processing"
+    assert record["progress"] == 30
+    assert "params" not in record
+    assert mcp_server.get_job("missing")["error_code"] == "VALIDATION"
+
+
+def test_generate_get_returns_finished_job_without_streaming(monkeypatch):
+    done = {"status": "complete", "progress": 100, "result": {"path": "out.mp4"}}
+    calls = _fake_statuses(monkeypatch, [done])
+    ctx = _FakeContext()
+
+    status = asyncio.run(mcp_server.generate_get("job-1", ctx, wait_ms=60_000))
+
+    assert status == done
+    assert len(calls) == 1
+    assert ctx.reports == []
+
+
+def test_preflight_reuses_recent_result(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        mcp_server.veo,
+        "preflight",
+        lambda: calls.append(1) or {"ok": True, "ffmpeg": {"installed": True}},
+    )
+    mcp_server._cached_preflight.cache_clear()
+
+    first = mcp_server.preflight()
+    first["ok"] = False
+    first["ffmpeg"]["installed"] = False
+
+    assert mcp_server.preflight() == {"ok": True, "ffmpeg": {"installed": True}}
+    assert len(calls) == 1
+
+
+def test_list_recent_videos_stream_reports_each_item(tmp_path, monkeypatch):
+    monkeypatch.setenv("VEO_OUTPUT_DIR", str(tmp_path))
+    videos = mcp_server.veo.StorageManager().videos_dir
+    for idx, name in enumerate(["old.mp4", "new.mp4"]):
+        path = videos / name
+        path.write_bytes(b"")
+        os.utime(path, ns=(idx, (idx + 1) * 1_000_000_000))
+    monkeypatch.setattr(
+        mcp_server, "get_video_info_batch", lambda paths, workers: [{"name": p.name} for p in paths]
+    )
+    ctx = _FakeContext()
+
+    listing = asyncio.run(mcp_server.list_recent_videos_stream(ctx, limit=5))
+
+    assert [item["metadata"]["name"] for item in listing] == ["new.mp4", "old.mp4"]
+    assert [p for p, _ in ctx.reports] == [1, 2]
+    assert sorted(m for _, m in ctx.reports) == sorted(item["path"] for item in listing)
+
+
+def test_client_sizes_are_clamped(monkeypatch):
+    limits = []
+    monkeypatch.setattr(
+        mcp_server, "_newest_videos", lambda videos_dir, limit: limits.append(limit) or []
+    )
+    deadlines = []
+
+    async def fake_stream(job_id, ctx, deadline, default_message=""):
+        deadlines.append(deadline - time.monotonic())
+        return {"status": "complete"}
+
+    monkeypatch.setattr(mcp_server, "_stream_job", fake_stream)
+    _fake_statuses(monkeypatch, [{"status": "processing", "progress": 0}])
+
+    asyncio.run(mcp_server.list_recent_videos(limit=10**9))
+    asyncio.run(mcp_server.list_recent_videos(limit=-5))
+    asyncio.run(mcp_server.generate_get("job-1", _FakeContext(), wait_ms=10**12))
+
+    assert limits == [mcp_server._MAX_LIST_LIMIT, 0]
+    assert deadlines[0] <= mcp_server._MAX_WAIT_MS / 1000.0
+
+
+@pytest.mark.parametrize("argv,warmed", [([], True), (["--no-warm"], False)])
+def test_main_warms_video_info_unless_disabled(monkeypatch, argv, warmed):
+    calls = []
+    monkeypatch.setattr(mcp_server, "_warm_video_info", lambda: calls.append("warm"))
+    monkeypatch.setattr(mcp_server.app, "run", lambda transport: calls.append(transport))
+
+    mcp_server.main(argv)
+
+    for thread in threading.enumerate():
+        if thread.name == "veo-mcp-warm":
+            thread.join(timeout=5)
+    assert ("warm" in calls) is warmed
+    assert "stdio" in calls
+
+
+def test_continue_video_cancels_prefetch_on_early_return(tmp_path, monkeypatch):
+    _fake_statuses(monkeypatch, [{"status": "failed", "progress": 0, "error_code": "UNKNOWN"}])
+    monkeypatch.setattr(mcp_server.veo, "generate_start", lambda params: {"job_id": "job-1"})
+    monkeypatch.setattr(mcp_server, "prefetch_stitch_metadata", lambda path: time.sleep(0.2))
+
+    async def scenario():
+        result = await mcp_server.continue_video(
+            str(tmp_path / "src.mp4"), "next", _FakeContext(), wait_ms=1000
+        )
+        await asyncio.sleep(0.01)
+        leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        return result, leftover
+
+    result, leftover = asyncio.run(scenario())
+
+    assert result["stage"] == "generation"
+    assert result["status"] == "failed"
+    assert leftover == []
@@ -0,0 +1,274 @@
+"""Tests for seamless stitching command construction."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from veotools.stitch import seamless
+
+
+def _install_fakes(monkeypatch, infos, keyframes, audio=True, encoders="", codecs=None):
+    calls = []
+    codecs = codecs or {}
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if "-encoders" in cmd:
+            return SimpleNamespace(stdout=encoders)
+        if "h264_nvenc" in cmd:
+            raise subprocess.CalledProcessError(1, cmd, stderr=b"no CUDA device")
+        if cmd[0] == "ffprobe" and any(arg.startswith("stream=codec_type") for arg in cmd):
+            codec, pix_fmt = codecs.get(Path(cmd[-1]).name, ("h264", "yuv420p"))
+            streams = [{"codec_type": "video", "codec_name": codec, "profile": "High", "pix_fmt": pix_fmt}]
+            if audio:
+                streams.append({"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000"})
+            return SimpleNamespace(stdout=json.dumps({"streams": streams}))
+        if cmd[0] == "ffprobe":
+            if "a" in cmd:
+                streams = [{"index": 1}] if audio else []
+                return SimpleNamespace(stdout=json.dumps({"streams": streams}))
+            packets = [{"pts_time": f"{t:.6f}", "flags": "K_"} for t in keyframes]
+            return SimpleNamespace(stdout=json.dumps({"packets": packets}))
+        if cmd[0] == "ffmpeg" and "concat" in cmd:
+            # The concat list lives in a temp dir that is cleaned up afterwards
+            list_path = cmd[cmd.index("-i") + 1]
+            calls.append(open(list_path).read())
+        return SimpleNamespace(stdout="")
+
+    info_iter = iter(infos)
+    seamless._hardware_h264_args.cache_clear()
+    monkeypatch.setattr(seamless, "_hardware_h264_unusable", False)
+    seamless._has_audio.cache_clear()
+    seamless._keyframes.cache_clear()
+    seamless._stream_signature.cache_clear()
+    monkeypatch.setenv("VEO_HW_ENCODE", "1")
+    monkeypatch.setattr(seamless.subprocess, "run", fake_run)
+    monkeypatch.setattr(seamless, "get_video_info", lambda path: next(info_iter))
+    return calls
+
+
+def test_stitch_videos_stream_copies_on_keyframe(tmp_path, monkeypatch):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        clip.write_bytes(b"")
+    info = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    calls = _install_fakes(monkeypatch, [info, info, info], keyframes=[0.0, 3.5, 7.0])
+
+    seamless.stitch_videos(clips, overlap=1.0, output_path=tmp_path / "out.mp4")
+
+    ffmpeg_cmds = [c for c in calls if isinstance(c, list) and c[0] == "ffmpeg"]
+    trim_cmd, concat_cmd = ffmpeg_cmds
+    assert "-filter_complex" not in trim_cmd + concat_cmd
+    assert "copy" in trim_cmd and "copy" in concat_cmd
+    # Cut just before the 7.0s keyframe: the two packets decoded ahead of it
+    assert trim_cmd[trim_cmd.index("-i") + 1] == str(clips[0].resolve())
+    assert trim_cmd[trim_cmd.index("-to") + 1] == "7.000000"
+    assert trim_cmd[trim_cmd.index("-frames:v") + 1] == "2"
+    assert calls[-1] == f"file '{trim_cmd[-1]}'\nfile '{clips[1].resolve()}'\n"
+
+
+def test_stitch_videos_reencodes_when_keyframe_misses_trim_point(tmp_path, monkeypatch):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        clip.write_bytes(b"")
+    info = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    # The nearest keyframe before the 7.0s trim point is 2s early
+    calls = _install_fakes(monkeypatch, [info, info, info], keyframes=[0.0, 2.5, 5.0, 7.5])
+
+    seamless.stitch_videos(clips, overlap=1.0, output_path=tmp_path / "out.mp4")
+
+    ffmpeg_cmds = [c for c in calls if isinstance(c, list) and c[0] == "ffmpeg"]
+    assert not any("concat" in c for c in ffmpeg_cmds)
+    (encode_cmd,) = [c for c in ffmpeg_cmds if "-filter_complex" in c]
+    assert "trim=0:7.000000" in encode_cmd[encode_cmd.index("-filter_complex") + 1]
+
+
+def test_stitch_videos_reencodes_mismatched_clips(tmp_path, monkeypatch):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        clip.write_bytes(b"")
+    hd = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    portrait = {"duration": 8.0, "fps": 24.0, "width": 720, "height": 1280}
+    calls = _install_fakes(
+        monkeypatch,
+        [hd, portrait, hd],
+        keyframes=[0.0, 5.0],
+        encoders=" V....D h264_nvenc           NVIDIA NVENC H.264 encoder\n",
+    )
+
+    seamless.stitch_videos(clips, overlap=1.0, output_path=tmp_path / "out.mp4")
+
+    encode_cmds = [c for c in calls if isinstance(c, list) and "-filter_complex" in c]
+    # The hardware encoder is tried first and falls back to libx264 when it can't open
+    assert [c[c.index("-c:v") + 1] for c in encode_cmds] == ["h264_nvenc", "libx264"]
+
+    # Later stitches remember the failure and go straight to software
+    calls.clear()
+    infos = iter([hd, portrait, hd])
+    monkeypatch.setattr(seamless, "get_video_info", lambda path: next(infos))
+    seamless.stitch_videos(clips, overlap=1.0, output_path=tmp_path / "out.mp4")
+    encode_cmds = [c for c in calls if isinstance(c, list) and "-filter_complex" in c]
+    assert [c[c.index("-c:v") + 1] for c in encode_cmds] == ["libx264"]
+
+
+def test_stitch_videos_honours_hw_encode_toggle_after_probe(tmp_path, monkeypatch):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        clip.write_bytes(b"")
+    hd = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    portrait = {"duration": 8.0, "fps": 24.0, "width": 720, "height": 1280}
+    calls = _install_fakes(
+        monkeypatch,
+        [hd, portrait, hd],
+        keyframes=[0.0, 5.0],
+        encoders=" V....D h264_videotoolbox    VideoToolbox H.264 Encoder\n",
+    )
+    seamless._hardware_h264_args()
+
+    # The cached encoder probe doesn't pin the setting for the process
+    monkeypatch.setenv("VEO_HW_ENCODE", "0")
+    seamless.stitch_videos(clips, overlap=1.0, output_path=tmp_path / "out.mp4")
+
+    encode_cmds = [c for c in calls if isinstance(c, list) and "-filter_complex" in c]
+    assert [c[c.index("-c:v") + 1] for c in encode_cmds] == ["libx264"]
+
+
+def test_keyframes_handles_missing_ffprobe(monkeypatch):
+    def missing(*args, **kwargs):
+        raise FileNotFoundError("ffprobe")
+
+    monkeypatch.setattr(seamless.subprocess, "run", missing)
+
+    assert seamless._keyframes("clip.mp4") == ()
+
+
+def test_prefetch_warms_stitch_probes(tmp_path, monkeypatch):
+    clip = tmp_path / "a.mp4"
+    clip.write_bytes(b"")
+    info = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    calls = _install_fakes(monkeypatch, [info], keyframes=[0.0, 5.0])
+
+    seamless.prefetch_stitch_metadata(clip)
+    probes = len(calls)
+
+    assert seamless._has_audio(clip) is True
+    assert seamless._keyframes(clip) == ((0.0, 0), (5.0, 1))
+    assert len(calls) == probes
+
+
+def test_stitch_videos_strict_mode_refuses_reencode(tmp_path, monkeypatch):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        clip.write_bytes(b"")
+    hd = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    portrait = {"duration": 8.0, "fps": 24.0, "width": 720, "height": 1280}
+    calls = _install_fakes(monkeypatch, [hd, portrait], keyframes=[0.0, 5.0])
+
+    with pytest.raises(RuntimeError, match="re-encoding is disabled"):
+        seamless.stitch_videos(
+            clips, overlap=1.0, output_path=tmp_path / "out.mp4", allow_reencode=False
+        )
+
+    assert not [c for c in calls if isinstance(c, list) and "-filter_complex" in c]
+
+
+def test_stitch_videos_strict_mode_reports_copy_failure(tmp_path, monkeypatch):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        clip.write_bytes(b"")
+    info = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    _install_fakes(monkeypatch, [info, info], keyframes=[0.0, 7.0])
+    fake_run = seamless.subprocess.run
+
+    def failing_concat(cmd, **kwargs):
+        if cmd[0] == "ffmpeg" and "concat" in cmd:
+            raise subprocess.CalledProcessError(1, cmd, stderr=b"Non-monotonic DTS")
+        return fake_run(cmd, **kwargs)
+
+    monkeypatch.setattr(seamless.subprocess, "run", failing_concat)
+
+    with pytest.raises(RuntimeError, match="Non-monotonic DTS") as excinfo:
+        seamless.stitch_videos(
+            clips, overlap=1.0, output_path=tmp_path / "out.mp4", allow_reencode=False
+        )
+
+    assert isinstance(excinfo.value.__cause__, subprocess.CalledProcessError)
+
+
+@pytest.mark.parametrize(
+    "codecs",
+    [{"b.mp4": ("hevc", "yuv420p")}, {"b.mp4": ("h264", "yuv444p")}],
+)
+def test_stitch_videos_reencodes_mismatched_codecs(tmp_path, monkeypatch, codecs):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        clip.write_bytes(b"")
+    info = {"duration": 8.0, "fps": 24.0, "width": 1280, "height": 720}
+    calls = _install_fakes(monkeypatch, [info, info, info], keyframes=[0.0, 7.0], codecs=codecs)
+
+    seamless.stitch_videos(clips, overlap=1.0, output_path=tmp_path / "out.mp4")
+
+    ffmpeg_cmds = [c for c in calls if isinstance(c, list) and c[0] == "ffmpeg"]
+    assert not any("concat" in c for c in ffmpeg_cmds)
+    assert [c for c in ffmpeg_cmds if "-filter_complex" in c]
+
+
+def _make_clip(path: Path, seconds: int = 3) -> None:
+    # B-frames make decode order differ from display order, like Veo's output
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-f", "lavfi", "-i", f"testsrc=size=320x240:rate=24:duration={seconds}",
+            "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=48000:duration={seconds}",
+            "-c:v", "libx264", "-g", "24", "-bf", "2", "-pix_fmt", "yuv420p",
+            "-c:a", "aac",
+            "-y", str(path),
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _count_frames(path: Path) -> int:
+    res = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-count_frames",
+            "-show_entries", "stream=nb_read_frames",
+            "-of", "json",
+            str(path),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(json.loads(res.stdout)["streams"][0]["nb_read_frames"])
+
+
+@pytest.mark.ffmpeg
+@pytest.mark.skipif(
+    not (shutil.which("ffmpeg") and shutil.which("ffprobe")),
+    reason="ffmpeg and ffprobe are required",
+)
+def test_stream_copy_stitch_trims_overlap_exactly(tmp_path):
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    for clip in clips:
+        _make_clip(clip)
+    seamless._has_audio.cache_clear()
+    seamless._keyframes.cache_clear()
+    seamless._stream_signature.cache_clear()
+
+    result = seamless.stitch_videos(
+        clips, overlap=1.0, output_path=tmp_path / "out.mp4", allow_reencode=False
+    )
+
+    # 3s + 3s minus the 1s overlap, at 24 fps
+    assert result.metadata.duration == pytest.approx(5.0, abs=0.05)
+    assert _count_frames(result.path) == 5 * 24